@@ -1,10 +1,43 @@
+import time
+INICIO = time.perf_counter()  # Referência para o relatório de inicialização (--perfil-inicio)
+
 import customtkinter as ctk
 import os
-import json
+import queue
 import sys
+import threading
+from itertools import islice
 from modelos.restaurante import Restaurante
-from modelos.avaliacao import Avaliacao
-from CTkMessagebox import CTkMessagebox
+from modelos.busca import MotorBusca
+from modelos import instrumentacao
+from modelos.instrumentacao import medido
+from lista_virtual import ListaVirtual
+
+TODAS_CATEGORIAS = "Todas as categorias"
+STATUS = {"Todos": None, "Aberto": True, "Fechado": False}
+MARCOS_INICIO = [("imports", time.perf_counter())]
+
+
+def mensagem(**kwargs):
+    """Abre um CTkMessagebox; o módulo só é importado na primeira mensagem exibida."""
+    from CTkMessagebox import CTkMessagebox
+    return CTkMessagebox(**kwargs)
+
+
+def marcar_inicio(etapa):
+    MARCOS_INICIO.append((etapa, time.perf_counter()))
+
+
+def relatorio_inicio():
+    """Tempo de cada etapa da inicialização, no estilo de python -X importtime."""
+    linhas = ["inicialização: acumulado (ms) | etapa (ms) | etapa"]
+    anterior = INICIO
+    for etapa, instante in MARCOS_INICIO:
+        linhas.append(f"inicialização: {(instante - INICIO) * 1000:10.1f} | {(instante - anterior) * 1000:10.1f} | {etapa}")
+        anterior = instante
+    linhas.append("Para o detalhe de cada import: python -X importtime app_gui.py")
+    return "\n".join(linhas)
+
 
 class RestauranteApp(ctk.CTk):
     def __init__(self):
@@ -33,28 +66,59 @@ class RestauranteApp(ctk.CTk):
             ("Excluir", self.excluir_restaurante)
         ]
 
+        self.botoes = []
         for text, command in actions:
-            ctk.CTkButton(self.action_frame, text=text, command=command, width=150).pack(side="left", padx=5)
+            botao = ctk.CTkButton(self.action_frame, text=text, command=command, width=150)
+            botao.pack(side="left", padx=5)
+            self.botoes.append(botao)
+
+        # Barra de progresso exibida enquanto os dados são carregados
+        self.barra_progresso = ctk.CTkProgressBar(self.main_frame)
+        self.barra_progresso.set(0)
 
-        # Frame rolável para lista de restaurantes
-        self.scrollable_frame = ctk.CTkScrollableFrame(self.main_frame)
-        self.scrollable_frame.pack(pady=10, fill="both", expand=True)
+        # Busca com filtros, atualizada a cada tecla digitada
+        self.busca = MotorBusca(Restaurante.restaurantes)
+        self.filtro_agendado = None
+        self.filtro_frame = ctk.CTkFrame(self.main_frame)
+        self.filtro_frame.pack(fill="x")
+        self.campo_busca = ctk.CTkEntry(self.filtro_frame, placeholder_text="Buscar por nome...", width=250)
+        self.campo_busca.pack(side="left", padx=5, pady=5)
+        self.campo_busca.bind("<KeyRelease>", self.agendar_filtro)
+        self.filtro_categoria = ctk.CTkOptionMenu(self.filtro_frame, values=[TODAS_CATEGORIAS], width=200,
+                                                  command=lambda _: self.atualizar_lista_restaurantes())
+        self.filtro_categoria.pack(side="left", padx=5)
+        self.filtro_status = ctk.CTkOptionMenu(self.filtro_frame, values=list(STATUS), width=100,
+                                               command=lambda _: self.atualizar_lista_restaurantes())
+        self.filtro_status.pack(side="left", padx=5)
+        self.campo_nota = ctk.CTkEntry(self.filtro_frame, placeholder_text="Nota mínima", width=100)
+        self.campo_nota.pack(side="left", padx=5)
+        self.campo_nota.bind("<KeyRelease>", self.agendar_filtro)
 
-        # Cabeçalho da lista
-        self.header_frame = ctk.CTkFrame(self.scrollable_frame)
-        self.header_frame.pack(fill="x", padx=5, pady=5)
-        
-        ctk.CTkLabel(self.header_frame, text="Nome", width=250).pack(side="left", padx=5)
-        ctk.CTkLabel(self.header_frame, text="Categoria", width=200).pack(side="left", padx=5)
-        ctk.CTkLabel(self.header_frame, text="Avaliação", width=100).pack(side="left", padx=5)
-        ctk.CTkLabel(self.header_frame, text="Status", width=100).pack(side="left", padx=5)
+        # Lista virtualizada de restaurantes (só as linhas visíveis têm widgets)
+        colunas = [("Nome", 250), ("Categoria", 200), ("Avaliação", 100), ("Status", 100)]
+        self.lista = ListaVirtual(self.main_frame, colunas, self.valores_linha,
+                                  ao_clicar=lambda r: self.mostrar_opcoes_restaurante(r._nome))
+        self.lista.pack(pady=10, fill="both", expand=True)
 
-        # Lista de restaurantes
-        self.restaurant_list = []
+        # O armazenamento (e o json, sqlite3 etc.) só é importado depois da primeira pintura
+        self.armazenamento = None
+        self.protocol("WM_DELETE_WINDOW", self.fechar)
+        self.bind("<F12>", self.salvar_perfil)
+        self.carregando = False
+        self.carga_com_erro = False
+        # A janela aparece antes da carga, com um aviso no lugar da lista
+        self.lista.mostrar_aviso("Carregando restaurantes...")
+        marcar_inicio("janela criada")
+        self.after_idle(self.iniciar_carga)
 
-        # Carregar dados iniciais
+    def iniciar_carga(self):
+        """Conclui o primeiro desenho da janela e só então começa a carregar os dados."""
+        self.update_idletasks()
+        marcar_inicio("primeira pintura")
+        from modelos.armazenamento import criar_armazenamento
+        self.armazenamento = criar_armazenamento(self.get_data_dir())
+        marcar_inicio("armazenamento")
         self.carregar_dados()
-        self.atualizar_lista_restaurantes()
 
     def get_data_dir(self):
         """Retorna o diretório onde os dados serão salvos."""
@@ -63,52 +127,179 @@ class RestauranteApp(ctk.CTk):
         return os.path.dirname(os.path.abspath(__file__))
 
     def carregar_dados(self):
-        """Carrega os dados dos restaurantes do arquivo JSON."""
-        ARQUIVO_DADOS = os.path.join(self.get_data_dir(), 'dados_restaurantes.json')
-        try:
-            with open(ARQUIVO_DADOS, 'r', encoding='utf-8') as arquivo:
-                dados = json.load(arquivo)
-                Restaurante.restaurantes.clear()
-                for restaurante_dados in dados:
-                    restaurante = Restaurante(
-                        restaurante_dados['nome'],
-                        restaurante_dados['categoria']
-                    )
-                    restaurante._ativo = restaurante_dados['ativo']
-                    restaurante._avaliacao = [Avaliacao(**avaliacao) for avaliacao in restaurante_dados['avaliacao']]
-        except FileNotFoundError:
-            CTkMessagebox(title="Informação", message=f"Arquivo de dados não encontrado. Criando um novo arquivo em {ARQUIVO_DADOS}")
+        """Inicia a carga dos restaurantes em segundo plano, sem bloquear a janela."""
+        Restaurante.restaurantes.clear()
+        if not self.armazenamento.existe():
+            mensagem(title="Informação", message=f"Arquivo de dados não encontrado. Criando um novo arquivo em {self.armazenamento.caminho}")
             self.salvar_dados()
+            self._finalizar_carga()
+            return
+
+        self.carregando = True
+        for botao in self.botoes:
+            botao.configure(state="disabled")
+        self.barra_progresso.set(0)
+        self.barra_progresso.pack(before=self.lista, fill="x", padx=5)
+        # Fila limitada: a leitura pausa se a interface ainda não consumiu os lotes anteriores
+        self.fila_carga = queue.Queue(maxsize=8)
+        threading.Thread(target=self._ler_dados, daemon=True).start()
+        self.after(20, self._consumir_carga)
+
+    def _ler_dados(self):
+        """Lê e valida os restaurantes fora da thread da interface, enviando-os em lotes."""
+        try:
+            leitura = self.armazenamento.iterar_restaurantes()
+            while True:
+                # A leitura (E/S e validação) é medida separada da espera pela fila cheia
+                with instrumentacao.medir('carga.ler_lote'):
+                    lote = list(islice(leitura, 1000))
+                if not lote:
+                    break
+                instrumentacao.contar('carga.restaurantes_lidos', len(lote))
+                with instrumentacao.medir('carga.espera_fila'):
+                    self.fila_carga.put(lote)
+            self.fila_carga.put(None)
+        except Exception as erro:
+            # Qualquer falha precisa chegar à interface, senão ela aguardaria a carga para sempre
+            self.fila_carga.put(erro)
+
+    @medido()
+    def _consumir_carga(self):
+        """Cria os restaurantes recebidos na thread da interface, por no máximo 50 ms por vez."""
+        limite = time.perf_counter() + 0.05
+        try:
+            while time.perf_counter() < limite:
+                try:
+                    lote = self.fila_carga.get_nowait()
+                except queue.Empty:
+                    break
+                if lote is None:
+                    self.armazenamento.concluir_carga()
+                    self._finalizar_carga()
+                    self.avisar_renomeados()
+                    return
+                if isinstance(lote, Exception):
+                    raise lote
+                for restaurante_dados in lote:
+                    Restaurante.from_dict(restaurante_dados)
+        except Exception as erro:
+            self.carga_com_erro = True
+            self._finalizar_carga()
+            mensagem(title="Erro", message=f"Erro ao carregar os dados: {erro}\nAs alterações foram desabilitadas.")
+            return
+        if len(Restaurante.restaurantes):
+            self.lista.mostrar_aviso("")
+        # Adianta a indexação da busca aos poucos, para não fazer tudo ao fim da carga
+        self.busca.sincronizar(prazo=time.perf_counter() + 0.02)
+        self.barra_progresso.set(self.armazenamento.progresso)
+        self.atualizar_lista_restaurantes()
+        self.after(20, self._consumir_carga)
+
+    def _finalizar_carga(self):
+        self.carregando = False
+        self.barra_progresso.pack_forget()
+        self.lista.mostrar_aviso("")
+        marcar_inicio("catálogo carregado")
+        if "--perfil-inicio" in sys.argv:
+            print(relatorio_inicio(), file=sys.stderr)
+        self.atualizar_lista_restaurantes()
+        if not self.carga_com_erro:
+            for botao in self.botoes:
+                botao.configure(state="normal")
+        self._sincronizar_busca()
+
+    def _sincronizar_busca(self):
+        """Completa os índices de busca em fatias de 20 ms e então preenche o menu de categorias."""
+        if self.busca.sincronizar(prazo=time.perf_counter() + 0.02):
+            self.atualizar_lista_restaurantes()
+        else:
+            self.after(10, self._sincronizar_busca)
+
+    def avisar_renomeados(self):
+        """Informa os restaurantes com nome repetido que foram renomeados na carga."""
+        renomeados = self.armazenamento.renomeados
+        if renomeados:
+            linhas = [f"'{original}' -> '{novo}'" for original, novo in renomeados[:10]]
+            if len(renomeados) > 10:
+                linhas.append(f"... e mais {len(renomeados) - 10}")
+            mensagem(title="Aviso", icon="warning",
+                     message="Restaurantes com nomes repetidos foram renomeados:\n" + "\n".join(linhas))
 
     def salvar_dados(self):
-        """Salva os dados dos restaurantes no arquivo JSON."""
-        ARQUIVO_DADOS = os.path.join(self.get_data_dir(), 'dados_restaurantes.json')
-        dados = [restaurante.to_dict() for restaurante in Restaurante.restaurantes]
-        with open(ARQUIVO_DADOS, 'w', encoding='utf-8') as arquivo:
-            json.dump(dados, arquivo, indent=4, ensure_ascii=False)
+        """Grava o estado completo dos restaurantes de forma atômica."""
+        self.armazenamento.compactar()
 
+    def salvar_perfil(self, event=None):
+        """Grava o relatório da instrumentação (F12). Requer RESTAURANTES_PERFIL=1."""
+        if not instrumentacao.ativa():
+            mensagem(title="Perfil", message="Inicie o aplicativo com RESTAURANTES_PERFIL=1 para coletar o perfil.")
+            return
+        caminho = os.path.join(self.get_data_dir(), 'perfil_restaurantes.json')
+        instrumentacao.salvar_relatorio(caminho)
+        mensagem(title="Perfil", message=f"Relatório de desempenho salvo em {caminho}")
+
+    def fechar(self):
+        """Compacta o log antes de fechar a janela."""
+        # Com a carga incompleta, o catálogo em memória não pode sobrescrever os dados salvos
+        if self.armazenamento is not None:
+            self.armazenamento.fechar(compactar=not (self.carregando or self.carga_com_erro))
+        self.destroy()
+
+    @staticmethod
+    def valores_linha(restaurante):
+        """Retorna os textos exibidos na linha de um restaurante."""
+        return restaurante.valores_linha()
+
+    def agendar_filtro(self, event=None):
+        """Aplica os filtros quando o usuário para de digitar por um instante."""
+        if self.filtro_agendado is not None:
+            self.after_cancel(self.filtro_agendado)
+        self.filtro_agendado = self.after(150, self.atualizar_lista_restaurantes)
+
+    def filtros_ativos(self):
+        """Retorna os argumentos de MotorBusca.consultar escolhidos na interface."""
+        filtros = {}
+        texto = self.campo_busca.get().strip()
+        if texto:
+            filtros['texto'] = texto
+        if self.filtro_categoria.get() != TODAS_CATEGORIAS:
+            filtros['categoria'] = self.filtro_categoria.get()
+        if STATUS[self.filtro_status.get()] is not None:
+            filtros['ativo'] = STATUS[self.filtro_status.get()]
+        try:
+            filtros['nota_minima'] = float(self.campo_nota.get().replace(',', '.'))
+        except ValueError:
+            pass
+        return filtros
+
+    @medido()
     def atualizar_lista_restaurantes(self):
         """Atualiza a lista de restaurantes exibida na interface."""
-        # Limpar a lista atual
-        for widget in self.restaurant_list:
-            widget.destroy()
-        self.restaurant_list.clear()
-        
-        # Adicionar restaurantes à lista
-        for restaurante in Restaurante.restaurantes:
-            frame = ctk.CTkFrame(self.scrollable_frame)
-            frame.pack(fill="x", padx=5, pady=2)
-            
-            ctk.CTkLabel(frame, text=restaurante._nome, width=250).pack(side="left", padx=5)
-            ctk.CTkLabel(frame, text=restaurante._categoria, width=200).pack(side="left", padx=5)
-            ctk.CTkLabel(frame, text=str(restaurante.media_avaliacoes), width=100).pack(side="left", padx=5)
-            ctk.CTkLabel(frame, text=restaurante.ativo, width=100).pack(side="left", padx=5)
-            
-            frame.bind("<Double-1>", lambda e, r=restaurante: self.mostrar_opcoes_restaurante(r._nome))
-            self.restaurant_list.append(frame)
+        self.filtro_agendado = None
+        filtros = self.filtros_ativos()
+        # Durante a carga os índices ainda estão incompletos, então a lista mostra tudo
+        if self.carregando or not filtros:
+            self.lista.definir_itens(Restaurante.restaurantes.sequencia)
+        else:
+            self.lista.definir_itens(self.busca.consultar(**filtros))
+        # O menu de categorias espera os índices; com muitas pendências, _sincronizar_busca o atualiza
+        if not self.carregando and self.busca.sincronizar(prazo=time.perf_counter() + 0.02):
+            categorias = [TODAS_CATEGORIAS] + self.busca.categorias
+            if categorias != self.filtro_categoria.cget("values"):
+                self.filtro_categoria.configure(values=categorias)
 
+    def atualizar_restaurante(self, restaurante):
+        """Redesenha a linha do restaurante; com filtros ativos refaz a lista, pois ele pode ter deixado de atendê-los."""
+        if self.filtros_ativos():
+            self.atualizar_lista_restaurantes()
+        else:
+            self.lista.atualizar_item(restaurante)
+
+    @medido()
     def mostrar_opcoes_restaurante(self, nome_restaurante):
         """Mostra uma janela com opções para o restaurante selecionado."""
+        if self.carregando or self.carga_com_erro:
+            return
         opcoes_window = ctk.CTkToplevel(self)
         opcoes_window.title(f"Opções para {nome_restaurante}")
         opcoes_window.geometry("300x200")
@@ -118,6 +309,7 @@ class RestauranteApp(ctk.CTk):
         ctk.CTkButton(opcoes_window, text="Alterar", command=lambda: self.alterar_restaurante(nome_restaurante)).pack(pady=10)
         ctk.CTkButton(opcoes_window, text="Excluir", command=lambda: self.excluir_restaurante(nome_restaurante)).pack(pady=10)
 
+    @medido()
     def cadastrar_restaurante(self):
         """Abre uma janela para cadastrar um novo restaurante."""
         dialog = ctk.CTkInputDialog(text="Nome do Restaurante:", title="Cadastrar Restaurante")
@@ -126,39 +318,45 @@ class RestauranteApp(ctk.CTk):
             dialog = ctk.CTkInputDialog(text="Categoria do Restaurante:", title="Cadastrar Restaurante")
             categoria = dialog.get_input()
             if categoria:
-                novo_restaurante = Restaurante(nome, categoria)
-                self.salvar_dados()
+                try:
+                    novo_restaurante = Restaurante(nome, categoria)
+                except ValueError as erro:
+                    mensagem(title="Erro", message=str(erro))
+                    return
+                self.armazenamento.registrar('criar', nome=novo_restaurante._nome, categoria=novo_restaurante._categoria)
                 self.atualizar_lista_restaurantes()
-                CTkMessagebox(title="Sucesso", message=f"Restaurante {nome} cadastrado com sucesso!")
+                mensagem(title="Sucesso", message=f"Restaurante {nome} cadastrado com sucesso!")
             else:
-                CTkMessagebox(title="Erro", message="Categoria não fornecida.")
+                mensagem(title="Erro", message="Categoria não fornecida.")
         else:
-            CTkMessagebox(title="Erro", message="Nome não fornecido.")
+            mensagem(title="Erro", message="Nome não fornecido.")
 
+    @medido()
     def habilitar_restaurante(self, nome_restaurante=None):
         """Habilita ou desabilita o restaurante selecionado."""
         if nome_restaurante is None:
             dialog = ctk.CTkInputDialog(text="Nome do Restaurante:", title="Habilitar/Desabilitar Restaurante")
             nome_restaurante = dialog.get_input()
         if nome_restaurante:
-            for restaurante in Restaurante.restaurantes:
-                if restaurante._nome.lower() == nome_restaurante.lower():
-                    restaurante.alternar_estado()
-                    self.salvar_dados()
-                    self.atualizar_lista_restaurantes()
-                    CTkMessagebox(title="Sucesso", message=f"Estado do restaurante {restaurante._nome} alterado para {restaurante.ativo}")
-                    return
-            CTkMessagebox(title="Erro", message="Restaurante não encontrado.")
+            restaurante = Restaurante.restaurantes.buscar(nome_restaurante)
+            if restaurante:
+                restaurante.alternar_estado()
+                self.armazenamento.registrar('estado', nome=restaurante._nome, ativo=restaurante._ativo)
+                self.atualizar_restaurante(restaurante)
+                mensagem(title="Sucesso", message=f"Estado do restaurante {restaurante._nome} alterado para {restaurante.ativo}")
+            else:
+                mensagem(title="Erro", message="Restaurante não encontrado.")
         else:
-            CTkMessagebox(title="Erro", message="Nome não fornecido.")
+            mensagem(title="Erro", message="Nome não fornecido.")
 
+    @medido()
     def avaliar_restaurante(self, nome_restaurante=None):
         """Abre uma janela para avaliar o restaurante selecionado."""
         if nome_restaurante is None:
             dialog = ctk.CTkInputDialog(text="Nome do Restaurante:", title="Avaliar Restaurante")
             nome_restaurante = dialog.get_input()
         if nome_restaurante:
-            restaurante = next((r for r in Restaurante.restaurantes if r._nome.lower() == nome_restaurante.lower()), None)
+            restaurante = Restaurante.restaurantes.buscar(nome_restaurante)
             if restaurante:
                 dialog = ctk.CTkInputDialog(text="Nome do Cliente:", title="Avaliar Restaurante")
                 cliente = dialog.get_input()
@@ -170,69 +368,73 @@ class RestauranteApp(ctk.CTk):
                             nota = float(nota)
                             if 0 <= nota <= 10:
                                 restaurante.receber_avaliacao(cliente, nota)
-                                self.salvar_dados()
-                                self.atualizar_lista_restaurantes()
-                                CTkMessagebox(title="Sucesso", message="Avaliação registrada com sucesso!")
+                                self.armazenamento.registrar('avaliar', nome=restaurante._nome, cliente=cliente, nota=nota)
+                                self.atualizar_restaurante(restaurante)
+                                mensagem(title="Sucesso", message="Avaliação registrada com sucesso!")
                             else:
-                                CTkMessagebox(title="Erro", message="A nota deve estar entre 0 e 10.")
+                                mensagem(title="Erro", message="A nota deve estar entre 0 e 10.")
                         except ValueError:
-                            CTkMessagebox(title="Erro", message="Por favor, digite um número válido para a nota.")
+                            mensagem(title="Erro", message="Por favor, digite um número válido para a nota.")
                     else:
-                        CTkMessagebox(title="Erro", message="Nota não fornecida.")
+                        mensagem(title="Erro", message="Nota não fornecida.")
                 else:
-                    CTkMessagebox(title="Erro", message="Nome do cliente não fornecido.")
+                    mensagem(title="Erro", message="Nome do cliente não fornecido.")
             else:
-                CTkMessagebox(title="Erro", message="Restaurante não encontrado.")
+                mensagem(title="Erro", message="Restaurante não encontrado.")
         else:
-            CTkMessagebox(title="Erro", message="Nome do restaurante não fornecido.")
+            mensagem(title="Erro", message="Nome do restaurante não fornecido.")
 
+    @medido()
     def alterar_restaurante(self, nome_restaurante=None):
         """Abre uma janela para alterar as informações do restaurante selecionado."""
         if nome_restaurante is None:
             dialog = ctk.CTkInputDialog(text="Nome do Restaurante:", title="Alterar Restaurante")
             nome_restaurante = dialog.get_input()
         if nome_restaurante:
-            restaurante = next((r for r in Restaurante.restaurantes if r._nome.lower() == nome_restaurante.lower()), None)
+            restaurante = Restaurante.restaurantes.buscar(nome_restaurante)
             if restaurante:
                 dialog = ctk.CTkInputDialog(text="Novo Nome (deixe em branco para não alterar):", title="Alterar Restaurante")
                 novo_nome = dialog.get_input()
                 dialog = ctk.CTkInputDialog(text="Nova Categoria (deixe em branco para não alterar):", title="Alterar Restaurante")
                 nova_categoria = dialog.get_input()
                 if novo_nome or nova_categoria:
-                    if novo_nome:
-                        restaurante._nome = novo_nome.title()
-                    if nova_categoria:
-                        restaurante._categoria = nova_categoria.upper()
-                    self.salvar_dados()
+                    nome_anterior = restaurante._nome
+                    try:
+                        Restaurante.restaurantes.alterar(restaurante, novo_nome, nova_categoria)
+                    except ValueError as erro:
+                        mensagem(title="Erro", message=str(erro))
+                        return
+                    self.armazenamento.registrar('alterar', nome=nome_anterior, novo_nome=novo_nome, nova_categoria=nova_categoria)
                     self.atualizar_lista_restaurantes()
-                    CTkMessagebox(title="Sucesso", message=f"Restaurante alterado com sucesso para: {restaurante}")
+                    mensagem(title="Sucesso", message=f"Restaurante alterado com sucesso para: {restaurante}")
                 else:
-                    CTkMessagebox(title="Erro", message="Nenhuma alteração fornecida.")
+                    mensagem(title="Erro", message="Nenhuma alteração fornecida.")
             else:
-                CTkMessagebox(title="Erro", message="Restaurante não encontrado.")
+                mensagem(title="Erro", message="Restaurante não encontrado.")
         else:
-            CTkMessagebox(title="Erro", message="Nome do restaurante não fornecido.")
+            mensagem(title="Erro", message="Nome do restaurante não fornecido.")
 
+    @medido()
     def excluir_restaurante(self, nome_restaurante=None):
         """Exclui o restaurante selecionado após confirmação do usuário."""
         if nome_restaurante is None:
             dialog = ctk.CTkInputDialog(text="Nome do Restaurante:", title="Excluir Restaurante")
             nome_restaurante = dialog.get_input()
         if nome_restaurante:
-            restaurante = next((r for r in Restaurante.restaurantes if r._nome.lower() == nome_restaurante.lower()), None)
+            restaurante = Restaurante.restaurantes.buscar(nome_restaurante)
             if restaurante:
-                confirmacao = CTkMessagebox(title="Confirmar Exclusão", 
+                confirmacao = mensagem(title="Confirmar Exclusão", 
                                             message=f"Tem certeza que deseja excluir o restaurante '{restaurante._nome}'?",
                                             icon="question", option_1="Sim", option_2="Não")
                 if confirmacao.get() == "Sim":
-                    Restaurante.restaurantes.remove(restaurante)
-                    self.salvar_dados()
+                    Restaurante.restaurantes.remover(restaurante)
+                    self.armazenamento.registrar('excluir', nome=restaurante._nome)
                     self.atualizar_lista_restaurantes()
-                    CTkMessagebox(title="Sucesso", message=f"Restaurante '{restaurante._nome}' excluído com sucesso.")
+                    mensagem(title="Sucesso", message=f"Restaurante '{restaurante._nome}' excluído com sucesso.")
             else:
-                CTkMessagebox(title="Erro", message="Restaurante não encontrado.")
+                mensagem(title="Erro", message="Restaurante não encontrado.")
         else:
-            CTkMessagebox(title="Erro", message="Nome do restaurante não fornecido.")
+            mensagem(title="Erro", message="Nome do restaurante não fornecido.")
 
 if __name__ == '__main__':
     app = RestauranteApp()
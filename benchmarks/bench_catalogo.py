@@ -0,0 +1,156 @@
+"""Benchmark do modelo e da persistência, sem interface gráfica.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.bench_catalogo --tamanhos 1000 100000 --saida resultado.json
+    python -m benchmarks.bench_catalogo --tamanhos 1000 --comparar resultado.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from modelos.armazenamento import ArmazenamentoJournal
+from modelos.busca import MotorBusca
+from modelos.restaurante import Restaurante
+
+CATEGORIAS = ['ITALIANA', 'JAPONESA', 'COMIDA CASEIRA', 'PIZZARIA', 'VEGANA', 'ÁRABE', 'MEXICANA', 'CHURRASCARIA']
+PALAVRAS = ['Sabor', 'Cantina', 'Sushi', 'Casa', 'Bistrô', 'Forno', 'Grill', 'Zen', 'Dona', 'Vila']
+CONSULTAS = 10000  # Buscas e avaliações feitas em cada medição
+OPERACOES_LOG = 1000  # Operações gravadas no log (cada uma com fsync)
+ATUALIZACOES_LISTA = 100  # Atualizações da lista em cada medição
+LINHAS_VISIVEIS = 20
+
+
+def gerar_catalogo(tamanho, avaliacoes_por_restaurante, semente=42):
+    """Cria um catálogo sintético no registro de restaurantes."""
+    aleatorio = random.Random(semente)
+    Restaurante.restaurantes.clear()
+    for indice in range(tamanho):
+        nome = f'{aleatorio.choice(PALAVRAS)} {aleatorio.choice(PALAVRAS)} {indice}'
+        restaurante = Restaurante(nome, aleatorio.choice(CATEGORIAS))
+        restaurante._ativo = aleatorio.random() < 0.5
+        for numero in range(avaliacoes_por_restaurante):
+            restaurante.receber_avaliacao(f'Cliente {numero}', float(aleatorio.randint(0, 10)))
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def medir_tamanho(tamanho, avaliacoes_por_restaurante, diretorio):
+    resultados = {}
+    aleatorio = random.Random(7)
+
+    resultados['gerar'] = cronometrar(lambda: gerar_catalogo(tamanho, avaliacoes_por_restaurante))
+    nomes = [restaurante._nome for restaurante in Restaurante.restaurantes]
+    sorteados = [aleatorio.choice(nomes) for _ in range(CONSULTAS)]
+
+    armazenamento = ArmazenamentoJournal(diretorio)
+    # salvar inclui o cache binário; salvar_cache mostra quanto dele é só o cache
+    resultados['salvar'] = cronometrar(armazenamento.compactar)
+    dados = [restaurante.to_dict() for restaurante in Restaurante.restaurantes]
+    resultados['salvar_cache'] = cronometrar(lambda: armazenamento._gravar_cache(dados, armazenamento._seq))
+    del dados
+    resultados['carregar_cache'] = cronometrar(ArmazenamentoJournal(diretorio).carregar)
+    # Sem o cache, a carga lê o JSON (e recria o cache, como na primeira abertura)
+    os.remove(armazenamento.arquivo_cache)
+    resultados['carregar_json'] = cronometrar(ArmazenamentoJournal(diretorio).carregar)
+
+    resultados['buscar_nome'] = cronometrar(lambda: [Restaurante.restaurantes.buscar(nome.upper()) for nome in sorteados])
+    restaurantes = [Restaurante.restaurantes.buscar(nome) for nome in sorteados]
+    resultados['avaliar'] = cronometrar(lambda: [r.receber_avaliacao('Bench', 7.5) for r in restaurantes])
+    # Sem compactação automática, registrar_log mede só as gravações no log
+    armazenamento.LIMITE_OPERACOES = float('inf')
+    resultados['registrar_log'] = cronometrar(
+        lambda: [armazenamento.registrar('avaliar', nome=nome, cliente='Bench', nota=7.5)
+                 for nome in sorteados[:OPERACOES_LOG]])
+
+    def compactar_log():
+        # A compactação disparada pelo log, em segundo plano (snapshot anterior + log)
+        armazenamento.compactar(em_segundo_plano=True)
+        armazenamento._compactacao.join()
+    resultados['compactar_log'] = cronometrar(compactar_log)
+    armazenamento.fechar(compactar=False)
+
+    resultados['medias'] = cronometrar(lambda: [r.media_avaliacoes for r in Restaurante.restaurantes])
+
+    busca = MotorBusca(Restaurante.restaurantes)
+    resultados['indexar_busca'] = cronometrar(busca.sincronizar)
+
+    def atualizar_lista(filtros):
+        # O trabalho de atualizar_lista_restaurantes sem a janela: consulta e textos das linhas visíveis
+        for _ in range(ATUALIZACOES_LISTA):
+            itens = busca.consultar(**filtros) if filtros else Restaurante.restaurantes.sequencia
+            [restaurante.valores_linha() for restaurante in itens[:LINHAS_VISIVEIS]]
+            busca.categorias
+    resultados['atualizar_lista'] = cronometrar(lambda: atualizar_lista({}))
+    resultados['atualizar_filtrada'] = cronometrar(
+        lambda: atualizar_lista({'texto': 'Sabor', 'categoria': 'JAPONESA', 'ativo': True, 'nota_minima': 5}))
+    resultados['buscar_prefixo'] = cronometrar(lambda: [busca.por_prefixo(nome[:6], limite=50)
+                                                        for nome in sorteados[:1000]])
+    resultados['buscar_aproximado'] = cronometrar(lambda: [busca.aproximados(nome[:-1]) for nome in sorteados[:100]])
+    resultados['filtrar'] = cronometrar(lambda: busca.consultar(categoria='JAPONESA', ativo=True, nota_minima=7))
+    resultados['melhores'] = cronometrar(lambda: busca.melhores(10))
+    Restaurante.restaurantes.cancelar_inscricao(busca)
+    return resultados
+
+
+def commit_atual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(resultado, anterior):
+    base = {(item['tamanho'], item['operacao']): item['segundos'] for item in anterior['resultados']}
+    print(f"\nComparação com {anterior.get('commit')}:", file=sys.stderr)
+    for item in resultado['resultados']:
+        antes = base.get((item['tamanho'], item['operacao']))
+        if antes:
+            print(f"{item['tamanho']:>9} {item['operacao']:<18} {antes:10.4f}s -> {item['segundos']:10.4f}s "
+                  f"({item['segundos'] / antes:5.2f}x)", file=sys.stderr)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--avaliacoes', type=int, default=3, help="Avaliações por restaurante")
+    parser.add_argument('--saida', help="Arquivo JSON com os resultados")
+    parser.add_argument('--comparar', help="Resultado anterior para comparação")
+    args = parser.parse_args(argumentos)
+
+    resultado = {
+        'commit': commit_atual(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'avaliacoes_por_restaurante': args.avaliacoes,
+        'resultados': [],
+    }
+    for tamanho in args.tamanhos:
+        with tempfile.TemporaryDirectory() as diretorio:
+            for operacao, segundos in medir_tamanho(tamanho, args.avaliacoes, diretorio).items():
+                resultado['resultados'].append({'tamanho': tamanho, 'operacao': operacao, 'segundos': segundos})
+                print(f"{tamanho:>9} {operacao:<18} {segundos:10.4f}s", file=sys.stderr)
+        Restaurante.restaurantes.clear()
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=4, ensure_ascii=False)
+    else:
+        json.dump(resultado, sys.stdout, indent=4, ensure_ascii=False)
+    if args.comparar and os.path.exists(args.comparar):
+        with open(args.comparar, 'r', encoding='utf-8') as arquivo:
+            comparar(resultado, json.load(arquivo))
+
+
+if __name__ == '__main__':
+    main()
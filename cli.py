@@ -0,0 +1,61 @@
+import argparse
+import multiprocessing
+import os
+import sys
+
+from modelos.armazenamento import criar_armazenamento
+from modelos.lote import exportar, importar
+from modelos.restaurante import Restaurante
+
+
+def get_data_dir():
+    """Retorna o diretório dos dados, o mesmo usado pela interface gráfica."""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Importação e exportação em lote do catálogo de restaurantes.")
+    parser.add_argument('--dados', default=get_data_dir(), help="Diretório do dados_restaurantes.json")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    importacao = subcomandos.add_parser('importar', help="Importa restaurantes e avaliações de CSV ou JSON Lines")
+    importacao.add_argument('arquivo')
+    importacao.add_argument('--formato', choices=['csv', 'jsonl'], help="Padrão: pela extensão do arquivo")
+    importacao.add_argument('--processos', type=int, help="Processos de validação (padrão: um por CPU)")
+    importacao.add_argument('--tamanho-bloco', type=int, default=5000, help="Linhas por bloco de validação")
+    importacao.add_argument('--estrito', action='store_true', help="Não grava nada se alguma linha tiver erro")
+
+    exportacao = subcomandos.add_parser('exportar', help="Exporta o catálogo para CSV ou JSON Lines")
+    exportacao.add_argument('arquivo')
+    exportacao.add_argument('--formato', choices=['csv', 'jsonl'], help="Padrão: pela extensão do arquivo")
+
+    args = parser.parse_args(argumentos)
+    armazenamento = criar_armazenamento(args.dados)
+    armazenamento.carregar()
+    for original, novo in armazenamento.renomeados:
+        print(f"Aviso: restaurante repetido '{original}' renomeado para '{novo}'", file=sys.stderr)
+
+    if args.comando == 'importar':
+        resultado = importar(args.arquivo, armazenamento, args.formato, args.processos, args.tamanho_bloco,
+                             args.estrito)
+        for linha, mensagem in resultado.erros:
+            print(f"Linha {linha}: {mensagem}", file=sys.stderr)
+        if args.estrito and resultado.erros:
+            print("Nenhum registro gravado (modo estrito).", file=sys.stderr)
+            armazenamento.fechar(compactar=False)
+            return 1
+        print(resultado)
+        armazenamento.fechar()
+        return 1 if resultado.erros else 0
+
+    quantidade = exportar(args.arquivo, Restaurante.restaurantes, args.formato)
+    armazenamento.fechar(compactar=False)
+    print(f"{quantidade} restaurantes exportados para {args.arquivo}")
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
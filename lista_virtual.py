@@ -0,0 +1,129 @@
+import customtkinter as ctk
+
+
+class ListaVirtual(ctk.CTkFrame):
+    """Lista rolável que cria widgets apenas para as linhas visíveis e os reaproveita."""
+
+    def __init__(self, master, colunas, valores_linha, ao_clicar=None, altura_linha=32, **kwargs):
+        super().__init__(master, **kwargs)
+        self._colunas = colunas  # Lista de (título, largura)
+        self._valores_linha = valores_linha  # Função item -> tupla de textos
+        self._ao_clicar = ao_clicar
+        self._altura_linha = altura_linha
+        self._itens = []
+        self._inicio = 0
+        self._linhas = []  # Pool de linhas reaproveitadas durante a rolagem
+        self._visiveis = 0
+
+        # Cabeçalho da lista
+        self.header_frame = ctk.CTkFrame(self)
+        self.header_frame.pack(fill="x", padx=5, pady=5)
+        for titulo, largura in colunas:
+            ctk.CTkLabel(self.header_frame, text=titulo, width=largura).pack(side="left", padx=5)
+
+        # Área das linhas e barra de rolagem
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._rolar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.corpo = ctk.CTkFrame(self, fg_color="transparent")
+        self.corpo.pack(fill="both", expand=True)
+        self.corpo.bind("<Configure>", self._ajustar_linhas)
+        self._vincular_rolagem(self.corpo)
+        self.aviso = ctk.CTkLabel(self.corpo, text="")
+
+    def definir_itens(self, itens):
+        """Define a sequência exibida (sem copiá-la); só as linhas visíveis que mudaram são redesenhadas."""
+        self._itens = itens
+        self._inicio = self._limitar(self._inicio)
+        self._renderizar()
+
+    def mostrar_aviso(self, texto):
+        """Exibe um texto sobre a lista (ex.: enquanto carrega); texto vazio esconde o aviso."""
+        if texto:
+            self.aviso.configure(text=texto)
+            self.aviso.place(relx=0.5, rely=0.3, anchor="center")
+            self.aviso.lift()
+        else:
+            self.aviso.place_forget()
+
+    def atualizar_item(self, item):
+        """Redesenha apenas a linha do item informado, caso esteja visível."""
+        for linha in self._linhas[:self._visiveis]:
+            if linha["item"] is item:
+                self._renderizar_linha(linha, item)
+
+    def _limitar(self, inicio):
+        maximo = max(len(self._itens) - self._visiveis, 0)
+        return min(max(inicio, 0), maximo)
+
+    def _ajustar_linhas(self, event=None):
+        """Cria ou esconde linhas do pool conforme a altura disponível."""
+        visiveis = max(self.corpo.winfo_height() // (self._altura_linha + 4), 1)
+        if visiveis == self._visiveis:
+            return
+        while len(self._linhas) < visiveis:
+            self._linhas.append(self._criar_linha())
+        for indice, linha in enumerate(self._linhas):
+            if indice < visiveis:
+                linha["frame"].pack(fill="x", padx=5, pady=2)
+            else:
+                linha["frame"].pack_forget()
+        self._visiveis = visiveis
+        self._inicio = self._limitar(self._inicio)
+        self._renderizar()
+
+    def _criar_linha(self):
+        frame = ctk.CTkFrame(self.corpo, height=self._altura_linha)
+        frame.pack_propagate(False)
+        linha = {"frame": frame, "labels": [], "valores": None, "item": None}
+        for _, largura in self._colunas:
+            label = ctk.CTkLabel(frame, text="", width=largura)
+            label.pack(side="left", padx=5)
+            linha["labels"].append(label)
+        for widget in [frame] + linha["labels"]:
+            widget.bind("<Double-1>", lambda e, l=linha: self._clicar(l))
+            self._vincular_rolagem(widget)
+        return linha
+
+    def _renderizar(self):
+        for deslocamento, linha in enumerate(self._linhas[:self._visiveis]):
+            indice = self._inicio + deslocamento
+            item = self._itens[indice] if indice < len(self._itens) else None
+            self._renderizar_linha(linha, item)
+
+        total = len(self._itens)
+        if total:
+            self.scrollbar.set(self._inicio / total, min((self._inicio + self._visiveis) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _renderizar_linha(self, linha, item):
+        valores = self._valores_linha(item) if item is not None else ("",) * len(self._colunas)
+        linha["item"] = item
+        if valores == linha["valores"]:
+            return
+        anteriores = linha["valores"] or (None,) * len(valores)
+        for label, texto, anterior in zip(linha["labels"], valores, anteriores):
+            if texto != anterior:
+                label.configure(text=texto)
+        linha["valores"] = valores
+
+    def _clicar(self, linha):
+        if self._ao_clicar and linha["item"] is not None:
+            self._ao_clicar(linha["item"])
+
+    def _vincular_rolagem(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self._rolar("scroll", -1 if e.delta > 0 else 1, "units"))
+        widget.bind("<Button-4>", lambda e: self._rolar("scroll", -1, "units"))
+        widget.bind("<Button-5>", lambda e: self._rolar("scroll", 1, "units"))
+
+    def _rolar(self, acao, valor, unidade="units"):
+        """Trata os comandos da barra de rolagem e da roda do mouse."""
+        if acao == "moveto":
+            inicio = int(float(valor) * len(self._itens))
+        else:
+            passo = self._visiveis if unidade == "pages" else 3
+            inicio = self._inicio + int(valor) * passo
+        inicio = self._limitar(inicio)
+        if inicio != self._inicio:
+            self._inicio = inicio
+            self._renderizar()
@@ -0,0 +1,287 @@
+import json
+import os
+import threading
+
+from modelos.cache_snapshot import GravadorCache, LeitorSnapshot
+from modelos.instrumentacao import contar, medido
+from modelos.registro import RegistroRestaurantes
+from modelos.restaurante import Restaurante
+
+
+def criar_armazenamento(diretorio):
+    """Escolhe o armazenamento: log de operações (padrão) ou SQLite, via RESTAURANTES_ARMAZENAMENTO."""
+    if os.environ.get('RESTAURANTES_ARMAZENAMENTO') == 'sqlite':
+        from modelos.repositorio_sqlite import RepositorioSQLite
+        return RepositorioSQLite(os.path.join(diretorio, 'dados_restaurantes.db'))
+    return ArmazenamentoJournal(diretorio)
+
+
+def aplicar_operacao(operacao):
+    # Reaplica uma operação do log sobre o registro de restaurantes
+    tipo = operacao['op']
+    if tipo == 'criar':
+        Restaurante(operacao['nome'], operacao['categoria'])
+        return
+    restaurante = Restaurante.restaurantes.buscar(operacao['nome'])
+    if restaurante is None:
+        raise ValueError(f"Operação '{tipo}' para restaurante inexistente: {operacao['nome']}")
+    if tipo == 'estado':
+        if restaurante._ativo != operacao['ativo']:
+            restaurante.alternar_estado()
+    elif tipo == 'avaliar':
+        restaurante.receber_avaliacao(operacao['cliente'], operacao['nota'])
+    elif tipo == 'alterar':
+        Restaurante.restaurantes.alterar(restaurante, operacao.get('novo_nome'), operacao.get('nova_categoria'))
+    elif tipo == 'excluir':
+        Restaurante.restaurantes.remover(restaurante)
+    else:
+        raise ValueError(f"Operação desconhecida: {tipo}")
+
+
+def aplicar_operacao_dados(restaurantes, chaves, operacao):
+    # Mesmo efeito de aplicar_operacao, mas sobre os dicionários do snapshot em disco.
+    # restaurantes: posição -> dados (na ordem do registro); chaves: chave do nome -> posição
+    tipo = operacao['op']
+    if tipo == 'criar':
+        nome = RegistroRestaurantes.normalizar_nome(operacao['nome'])
+        categoria = RegistroRestaurantes.normalizar_categoria(operacao['categoria'])
+        posicao = next(reversed(restaurantes), -1) + 1
+        restaurantes[posicao] = {'nome': nome, 'categoria': categoria, 'ativo': False, 'avaliacao': []}
+        chaves[RegistroRestaurantes.chave(nome)] = posicao
+        return
+    chave = RegistroRestaurantes.chave(operacao['nome'])
+    if chave not in chaves:
+        raise ValueError(f"Operação '{tipo}' para restaurante inexistente: {operacao['nome']}")
+    dados = restaurantes[chaves[chave]]
+    if tipo == 'estado':
+        dados['ativo'] = operacao['ativo']
+    elif tipo == 'avaliar':
+        dados['avaliacao'].append({'cliente': operacao['cliente'], 'nota': operacao['nota']})
+    elif tipo == 'alterar':
+        if operacao.get('novo_nome'):
+            dados['nome'] = RegistroRestaurantes.normalizar_nome(operacao['novo_nome'])
+            chaves[RegistroRestaurantes.chave(dados['nome'])] = chaves.pop(chave)
+        if operacao.get('nova_categoria'):
+            dados['categoria'] = RegistroRestaurantes.normalizar_categoria(operacao['nova_categoria'])
+    elif tipo == 'excluir':
+        del restaurantes[chaves.pop(chave)]
+    else:
+        raise ValueError(f"Operação desconhecida: {tipo}")
+
+
+def sincronizar_diretorio(caminho):
+    # Garante que a renomeação de um arquivo no diretório chegou ao disco
+    try:
+        descritor = os.open(os.path.dirname(os.path.abspath(caminho)), os.O_RDONLY)
+    except OSError:
+        return  # Windows não permite abrir diretórios; lá o os.replace já é durável
+    try:
+        os.fsync(descritor)
+    finally:
+        os.close(descritor)
+
+
+class ArmazenamentoJournal:
+    # Quantidade de operações no log que dispara uma compactação em segundo plano
+    LIMITE_OPERACOES = 500
+
+    def __init__(self, diretorio, nome='dados_restaurantes'):
+        self.arquivo_snapshot = os.path.join(diretorio, nome + '.json')
+        self.caminho = self.arquivo_snapshot
+        self.arquivo_log = os.path.join(diretorio, nome + '.log')
+        # Cópia binária do snapshot, lida na inicialização no lugar do JSON quando está atualizada
+        self.arquivo_cache = os.path.join(diretorio, nome + '.cache')
+        self._lock = threading.Lock()
+        self._log = None
+        self._seq = 0  # Número da última operação registrada
+        self._operacoes_pendentes = 0  # Operações no log desde a última compactação
+        self._compactacao = None
+        self._leitor = None
+        self.progresso = 0.0
+        self.renomeados = []  # Restaurantes com nome repetido renomeados na última carga
+
+    def existe(self):
+        return os.path.exists(self.arquivo_snapshot)
+
+    @medido()
+    def carregar(self):
+        """Lê o snapshot e reaplica o log. Retorna False se não havia snapshot."""
+        Restaurante.restaurantes.clear()
+        for restaurante_dados in self.iterar_restaurantes():
+            Restaurante.from_dict(restaurante_dados)
+        self.concluir_carga()
+        return self.existe()
+
+    def iterar_restaurantes(self):
+        """Lê o snapshot aos poucos, validando e devolvendo um restaurante por vez.
+
+        Usa o cache binário quando ele corresponde ao JSON atual; caso contrário lê o JSON
+        e aproveita a leitura para recriar o cache.
+        """
+        self._leitor = None
+        if not self.existe():
+            self.progresso = 1.0
+            return
+        self._leitor = LeitorSnapshot(self.arquivo_snapshot, self.arquivo_cache)
+        for restaurante_dados in self._leitor:
+            self.progresso = self._leitor.progresso
+            yield restaurante_dados
+        self.renomeados = self._leitor.renomeados
+        self.progresso = 1.0
+
+    @medido()
+    def concluir_carga(self):
+        """Reaplica as operações do log posteriores ao snapshot."""
+        # Arquivos antigos guardam apenas a lista de restaurantes e não têm seq
+        seq_snapshot = self._leitor.seq if self._leitor is not None else 0
+        self._seq = seq_snapshot
+        self._operacoes_pendentes = 0
+        for operacao in self._ler_log():
+            if operacao['seq'] > seq_snapshot:
+                aplicar_operacao(operacao)
+                self._seq = operacao['seq']
+                self._operacoes_pendentes += 1
+
+    def _ler_log(self):
+        if not os.path.exists(self.arquivo_log):
+            return []
+        operacoes = []
+        tamanho_valido = 0
+        with open(self.arquivo_log, 'rb') as arquivo:
+            for linha in arquivo:
+                try:
+                    if not linha.endswith(b'\n'):
+                        raise ValueError("linha incompleta")
+                    operacoes.append(json.loads(linha.decode('utf-8')))
+                except ValueError:
+                    # Linha incompleta de uma gravação interrompida: o restante é descartado
+                    break
+                tamanho_valido += len(linha)
+            corrompido = arquivo.seek(0, os.SEEK_END) > tamanho_valido
+        if corrompido:
+            # Remove o trecho inválido para que as próximas operações não sejam anexadas a ele
+            with open(self.arquivo_log, 'r+b') as arquivo:
+                arquivo.truncate(tamanho_valido)
+        return operacoes
+
+    def registrar(self, operacao, **dados):
+        """Acrescenta uma operação ao log e garante que ela chegou ao disco."""
+        self.registrar_lote([(operacao, dados)])
+
+    @medido()
+    def registrar_lote(self, operacoes):
+        """Acrescenta várias operações (tipo, dados) ao log com uma única sincronização em disco."""
+        if not operacoes:
+            return
+        with self._lock:
+            linhas = []
+            for operacao, dados in operacoes:
+                self._seq += 1
+                linhas.append(json.dumps({'seq': self._seq, 'op': operacao, **dados}, ensure_ascii=False) + '\n')
+            if self._log is None:
+                self._log = open(self.arquivo_log, 'a', encoding='utf-8')
+            self._log.write(''.join(linhas))
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._operacoes_pendentes += len(linhas)
+        contar('journal.operacoes', len(linhas))
+        if self._operacoes_pendentes >= self.LIMITE_OPERACOES:
+            self.compactar(em_segundo_plano=True)
+
+    @medido()
+    def compactar(self, em_segundo_plano=False):
+        """Grava um snapshot e remove do log as operações já incluídas.
+
+        Em segundo plano o novo snapshot é montado a partir do snapshot anterior e do log,
+        sem ler o catálogo em memória; assim a thread da interface não fica bloqueada.
+        """
+        if self._compactacao is not None and self._compactacao.is_alive():
+            if em_segundo_plano:
+                return
+            self._compactacao.join()
+        with self._lock:
+            seq = self._seq
+            self._operacoes_pendentes = 0
+        if em_segundo_plano:
+            self._compactacao = threading.Thread(target=self._compactar_do_disco, args=(seq,))
+            self._compactacao.start()
+        else:
+            with self._lock:
+                dados = [restaurante.to_dict() for restaurante in Restaurante.restaurantes]
+                seq = self._seq
+            self._gravar_snapshot(dados, seq)
+
+    @medido()
+    def _compactar_do_disco(self, seq):
+        restaurantes = {}
+        chaves = {}
+        seq_snapshot = 0
+        if self.existe():
+            # Os mesmos leitores da carga, para que nomes repetidos recebam os mesmos sufixos
+            leitor = LeitorSnapshot(self.arquivo_snapshot, self.arquivo_cache, gravar_cache=False)
+            for posicao, dados in enumerate(leitor):
+                if not isinstance(dados['avaliacao'], list):
+                    dados['avaliacao'] = dados['avaliacao'].to_dict()
+                restaurantes[posicao] = dados
+                chaves[RegistroRestaurantes.chave(dados['nome'])] = posicao
+            seq_snapshot = leitor.seq
+        with self._lock:
+            operacoes = self._ler_log()
+        for operacao in operacoes:
+            if seq_snapshot < operacao['seq'] <= seq:
+                aplicar_operacao_dados(restaurantes, chaves, operacao)
+        self._gravar_snapshot(list(restaurantes.values()), seq)
+
+    @medido()
+    def _gravar_snapshot(self, dados, seq):
+        self._gravar_atomico(self.arquivo_snapshot, {'seq': seq, 'restaurantes': dados})
+        self._gravar_cache(dados, seq)
+        with self._lock:
+            restantes = [operacao for operacao in self._ler_log() if operacao['seq'] > seq]
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            temporario = self.arquivo_log + '.tmp'
+            with open(temporario, 'w', encoding='utf-8') as arquivo:
+                for operacao in restantes:
+                    arquivo.write(json.dumps(operacao, ensure_ascii=False) + '\n')
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+            os.replace(temporario, self.arquivo_log)
+            sincronizar_diretorio(self.arquivo_log)
+
+    @medido()
+    def _gravar_cache(self, dados, seq):
+        gravador = None
+        try:
+            gravador = GravadorCache(self.arquivo_cache, self.arquivo_snapshot)
+            for restaurante_dados in dados:
+                gravador.adicionar(restaurante_dados)
+            gravador.concluir(seq)
+        except OSError:
+            # O cache é só uma otimização; sem ele a próxima carga lê o JSON
+            if gravador is not None:
+                gravador.descartar()
+
+    @staticmethod
+    def _gravar_atomico(caminho, dados):
+        # Escreve em um arquivo temporário e o renomeia, para nunca deixar um arquivo truncado
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo, indent=4, ensure_ascii=False)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, caminho)
+        # O log só é reescrito depois que a troca do snapshot está garantida em disco
+        sincronizar_diretorio(caminho)
+
+    def fechar(self, compactar=True):
+        """Compacta o log pendente e fecha o arquivo de log."""
+        if compactar:
+            self.compactar()
+        elif self._compactacao is not None:
+            self._compactacao.join()
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
@@ -1,11 +1,83 @@
+import sys
+from array import array
+
+
 class Avaliacao:
+    # __slots__ evita um __dict__ por instância
+    __slots__ = ('_cliente', '_nota')
+
     def __init__(self, cliente, nota):
         self._cliente = cliente  # Nome do cliente que fez a avaliação
         self._nota = nota  # Nota dada pelo cliente
 
     # Método para converter o objeto Avaliacao em um dicionário para salvar em JSON
-    def __dict__(self):
+    def to_dict(self):
         return {
             'cliente': self._cliente,
             'nota': self._nota
         }
+
+    @classmethod
+    def from_dict(cls, dados):
+        return cls(dados['cliente'], dados['nota'])
+
+
+class ColecaoAvaliacoes:
+    # Guarda as avaliações em colunas: notas em um array de floats e nomes de clientes internados
+    __slots__ = ('_clientes', '_notas')
+
+    def __init__(self, avaliacoes=()):
+        self._clientes = []
+        self._notas = array('d')
+        for avaliacao in avaliacoes:
+            self.append(avaliacao)
+
+    def adicionar(self, cliente, nota):
+        if not isinstance(cliente, str):
+            raise ValueError("O nome do cliente deve ser um texto.")
+        self._clientes.append(sys.intern(cliente))
+        self._notas.append(nota)
+
+    def append(self, avaliacao):
+        self.adicionar(avaliacao._cliente, avaliacao._nota)
+
+    @property
+    def notas(self):
+        return self._notas
+
+    def __len__(self):
+        return len(self._notas)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            # Como em uma lista, o fatiamento devolve outra coleção
+            colecao = ColecaoAvaliacoes()
+            colecao._clientes = self._clientes[indice]
+            colecao._notas = self._notas[indice]
+            return colecao
+        return Avaliacao(self._clientes[indice], self._notas[indice])
+
+    def __iter__(self):
+        # As instâncias de Avaliacao são criadas apenas durante a iteração
+        for cliente, nota in zip(self._clientes, self._notas):
+            yield Avaliacao(cliente, nota)
+
+    def to_dict(self):
+        return [{'cliente': cliente, 'nota': nota} for cliente, nota in zip(self._clientes, self._notas)]
+
+    def colunas(self):
+        return list(self._clientes), self._notas.tobytes()
+
+    @classmethod
+    def from_colunas(cls, clientes, notas):
+        colecao = cls()
+        colecao._clientes = [sys.intern(cliente) for cliente in clientes]
+        colecao._notas.frombytes(notas)
+        return colecao
+
+    @classmethod
+    def from_dict(cls, dados):
+        colecao = cls()
+        for avaliacao in dados:
+            colecao.adicionar(avaliacao['cliente'], avaliacao['nota'])
+        return colecao
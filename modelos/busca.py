@@ -0,0 +1,211 @@
+from bisect import bisect_left, bisect_right, insort
+import math
+import time
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+
+from modelos.registro import RegistroRestaurantes
+
+SEM_NOTA = -1.0  # Posição no índice de notas dos restaurantes ainda não avaliados
+
+
+def trigramas(texto):
+    texto = f'  {texto} '
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+class MotorBusca:
+    """Índices de busca sobre o registro de restaurantes, atualizados incrementalmente.
+
+    Mudanças chegam pelo registro e ficam pendentes até a próxima consulta, assim uma
+    carga grande reconstrói os índices uma única vez em vez de inserir item a item.
+    """
+
+    # Acima desta fração de pendências, os índices ordenados são reconstruídos do zero
+    FRACAO_RECONSTRUCAO = 0.1
+    SIMILARIDADE_MINIMA = 0.3
+    # Limite de candidatos avaliados na busca aproximada, para o custo não crescer com o catálogo
+    MAXIMO_CANDIDATOS = 2000
+    TAMANHO_LOTE = 1000  # Restaurantes indexados entre uma verificação do prazo e outra
+
+    def __init__(self, registro):
+        self.limpo()
+        for restaurante in registro:
+            self._pendentes.add(restaurante)
+        registro.inscrever(self)
+
+    # Métodos chamados pelo RegistroRestaurantes
+    def adicionado(self, restaurante):
+        self._pendentes.add(restaurante)
+
+    def alterado(self, restaurante):
+        self._pendentes.add(restaurante)
+
+    def removido(self, restaurante):
+        self._pendentes.discard(restaurante)
+        if restaurante in self._estado:
+            self._desindexar(restaurante, ordenados=not self._reconstruir)
+
+    def limpo(self):
+        self._estado = {}  # restaurante -> valores indexados (para remover entradas antigas)
+        self._pendentes = set()
+        self._reconstruir = False  # Listas ordenadas aguardando reconstrução
+        self._nomes = []  # Chaves dos nomes em ordem alfabética
+        self._por_nome = {}  # chave do nome -> restaurante
+        self._trigramas = {}  # trigrama -> restaurantes
+        self._categorias = {}  # categoria -> restaurantes
+        self._status = {True: set(), False: set()}
+        self._notas = []  # (média, chave do nome) em ordem crescente
+
+    @property
+    def categorias(self):
+        self.sincronizar()
+        return sorted(categoria for categoria, itens in self._categorias.items() if itens)
+
+    @staticmethod
+    def _media(restaurante):
+        if not restaurante._quantidade_notas:
+            return SEM_NOTA
+        return restaurante._soma_notas / restaurante._quantidade_notas
+
+    @property
+    def sincronizado(self):
+        return not self._pendentes and not self._reconstruir
+
+    def sincronizar(self, prazo=None):
+        """Aplica nos índices as mudanças pendentes.
+
+        Com prazo (um instante de time.perf_counter), para ao atingi-lo e retorna False se ainda
+        houver pendências; a chamada seguinte continua de onde esta parou. A ordenação final
+        dos nomes e notas, quando necessária, é feita de uma vez.
+        """
+        pendentes = self._pendentes
+        if len(pendentes) > self.FRACAO_RECONSTRUCAO * max(len(self._estado), 1):
+            self._reconstruir = True
+        while pendentes:
+            lote = [pendentes.pop() for _ in range(min(len(pendentes), self.TAMANHO_LOTE))]
+            # Primeiro remove as entradas antigas do lote: um restaurante renomeado pode ter
+            # liberado o nome de outro pendente, e a remoção tardia apagaria a entrada nova
+            for restaurante in lote:
+                if restaurante in self._estado:
+                    self._desindexar(restaurante, ordenados=not self._reconstruir)
+            for restaurante in lote:
+                self._indexar(restaurante, ordenados=not self._reconstruir)
+            if prazo is not None and (pendentes or self._reconstruir) and time.perf_counter() >= prazo:
+                return False  # Sem pendências, a ordenação final fica para a próxima chamada
+        if self._reconstruir:
+            self._nomes = sorted(self._por_nome)
+            # Ordena pelo nome e depois, de forma estável, pela média: evita comparar tuplas
+            notas = sorted(((estado[3], estado[0]) for estado in self._estado.values()), key=itemgetter(1))
+            notas.sort(key=itemgetter(0))
+            self._notas = notas
+            self._reconstruir = False
+        return True
+
+    def _indexar(self, restaurante, ordenados):
+        chave = RegistroRestaurantes.chave(restaurante._nome)
+        grams = trigramas(chave)
+        media = self._media(restaurante)
+        self._estado[restaurante] = (chave, restaurante._categoria, restaurante._ativo, media, len(grams))
+        self._por_nome[chave] = restaurante
+        for gram in grams:
+            self._trigramas.setdefault(gram, set()).add(restaurante)
+        self._categorias.setdefault(restaurante._categoria, set()).add(restaurante)
+        self._status[restaurante._ativo].add(restaurante)
+        if ordenados:
+            insort(self._nomes, chave)
+            insort(self._notas, (media, chave))
+
+    def _desindexar(self, restaurante, ordenados):
+        chave, categoria, ativo, media, _ = self._estado.pop(restaurante)
+        # Entre lotes, o nome antigo pode já pertencer a outro restaurante indexado
+        if self._por_nome.get(chave) is restaurante:
+            del self._por_nome[chave]
+        for gram in trigramas(chave):
+            self._trigramas[gram].discard(restaurante)
+        self._categorias[categoria].discard(restaurante)
+        self._status[ativo].discard(restaurante)
+        if ordenados:
+            del self._nomes[bisect_left(self._nomes, chave)]
+            del self._notas[bisect_left(self._notas, (media, chave))]
+
+    def por_prefixo(self, prefixo, limite=None):
+        self.sincronizar()
+        prefixo = RegistroRestaurantes.chave(prefixo)
+        inicio = bisect_left(self._nomes, prefixo)
+        # '\U0010ffff' é maior que qualquer caractere que possa seguir o prefixo
+        fim = bisect_right(self._nomes, prefixo + '\U0010ffff', inicio)
+        if limite is not None:
+            fim = min(fim, inicio + limite)
+        return [self._por_nome[chave] for chave in self._nomes[inicio:fim]]
+
+    def aproximados(self, texto, limite=50):
+        """Nomes parecidos com o texto, pela similaridade de trigramas.
+
+        Os candidatos vêm dos trigramas mais raros do texto, até MAXIMO_CANDIDATOS; só eles
+        têm a similaridade calculada.
+        """
+        self.sincronizar()
+        grams = trigramas(RegistroRestaurantes.chave(texto))
+        listas = sorted((self._trigramas[gram] for gram in grams if self._trigramas.get(gram)), key=len)
+        # Com similaridade mínima t, um nome parecido tem ao menos t * len(grams) trigramas em comum,
+        # todos entre as listas existentes; por isso aparece em alguma das mais raras
+        necessarias = len(listas) - math.ceil(self.SIMILARIDADE_MINIMA * len(grams)) + 1
+        candidatos = set()
+        for restaurantes in listas[:necessarias]:
+            if len(candidatos) + len(restaurantes) > self.MAXIMO_CANDIDATOS:
+                if not candidatos:
+                    candidatos.update(islice(restaurantes, self.MAXIMO_CANDIDATOS))
+                break
+            candidatos.update(restaurantes)
+        contagem = Counter()
+        for restaurantes in listas:
+            contagem.update(restaurantes & candidatos)  # Custo limitado pelo tamanho dos candidatos
+        resultado = []
+        for restaurante, comuns in contagem.items():
+            similaridade = comuns / (len(grams) + self._estado[restaurante][4] - comuns)
+            if similaridade >= self.SIMILARIDADE_MINIMA:
+                resultado.append((similaridade, restaurante))
+        resultado.sort(key=lambda item: (-item[0], self._estado[item[1]][0]))
+        return [restaurante for _, restaurante in resultado[:limite]]
+
+    def por_nota(self, minima=None, maxima=None):
+        """Restaurantes com média entre minima e maxima, da maior para a menor."""
+        self.sincronizar()
+        inicio = bisect_left(self._notas, (minima if minima is not None else 0.0,))
+        fim = len(self._notas) if maxima is None else bisect_right(self._notas, (maxima, '\U0010ffff'))
+        return [self._por_nome[chave] for _, chave in reversed(self._notas[inicio:fim])]
+
+    def melhores(self, quantidade=10):
+        self.sincronizar()
+        resultado = []
+        for media, chave in reversed(self._notas):
+            if media == SEM_NOTA or len(resultado) == quantidade:
+                break
+            resultado.append(self._por_nome[chave])
+        return resultado
+
+    def consultar(self, texto='', categoria=None, ativo=None, nota_minima=None, nota_maxima=None):
+        """Combina os filtros; sem texto o resultado segue a ordem alfabética."""
+        self.sincronizar()
+        filtros = []
+        if categoria is not None:
+            filtros.append(self._categorias.get(categoria, set()))
+        if ativo is not None:
+            filtros.append(self._status[ativo])
+        if nota_minima is not None or nota_maxima is not None:
+            filtros.append(set(self.por_nota(nota_minima, nota_maxima)))
+
+        texto = texto.strip()
+        if texto:
+            candidatos = self.por_prefixo(texto)
+            if len(candidatos) < 50 and len(texto) >= 3:
+                encontrados = set(candidatos)
+                candidatos += [r for r in self.aproximados(texto) if r not in encontrados]
+        elif filtros:
+            filtros.sort(key=len)
+            candidatos = sorted(filtros.pop(0), key=lambda r: self._estado[r][0])
+        else:
+            return [self._por_nome[chave] for chave in self._nomes]
+        return [r for r in candidatos if all(r in filtro for filtro in filtros)]
@@ -0,0 +1,181 @@
+import marshal
+import os
+import sys
+from array import array
+
+from modelos.avaliacao import ColecaoAvaliacoes
+from modelos.instrumentacao import contar
+from modelos.leitor_json import LeitorRestaurantes
+
+# O formato do marshal depende da versão do Python, que por isso faz parte da assinatura
+VERSAO = (1, marshal.version, sys.version_info[:2])
+TAMANHO_LOTE = 1000  # Restaurantes por chamada ao marshal; uma chamada por registro seria bem mais lenta
+
+
+class CacheInvalido(ValueError):
+    pass
+
+
+def _assinatura(caminho_json):
+    # O cache só vale para o JSON com a mesma data de modificação e tamanho
+    estado = os.stat(caminho_json)
+    return (VERSAO, estado.st_mtime_ns, estado.st_size)
+
+
+def ler_cache(caminho_cache, caminho_json):
+    """Abre o cache binário do snapshot; retorna None se ele não existir ou estiver desatualizado."""
+    try:
+        arquivo = open(caminho_cache, 'rb')
+    except OSError:
+        return None
+    try:
+        if marshal.load(arquivo) != _assinatura(caminho_json):
+            arquivo.close()
+            return None
+    except (EOFError, ValueError, TypeError, OSError):
+        arquivo.close()
+        return None
+    return LeitorCache(arquivo)
+
+
+class LeitorCache:
+    """Devolve os restaurantes do cache um por vez, no formato aceito por Restaurante.from_dict."""
+
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+        self.tamanho_total = os.fstat(arquivo.fileno()).st_size
+        self.seq = 0
+
+    @property
+    def progresso(self):
+        return self._arquivo.tell() / self.tamanho_total if self.tamanho_total else 1.0
+
+    def __iter__(self):
+        with self._arquivo:
+            while True:
+                # Qualquer registro fora do formato esperado invalida o cache
+                try:
+                    tipo, conteudo = marshal.load(self._arquivo)
+                    if tipo == 'fim' and isinstance(conteudo, int):
+                        self.seq = conteudo
+                        return
+                    if tipo != 'lote':
+                        raise ValueError(f"registro desconhecido: {tipo!r}")
+                    lote = [{'nome': nome, 'categoria': categoria, 'ativo': ativo,
+                             'avaliacao': ColecaoAvaliacoes.from_colunas(clientes, notas)}
+                            for nome, categoria, ativo, clientes, notas in conteudo]
+                except (EOFError, ValueError, TypeError) as erro:
+                    raise CacheInvalido(f"Cache do snapshot corrompido: {erro}") from None
+                yield from lote
+
+
+class GravadorCache:
+    """Grava o cache enquanto o snapshot é lido ou escrito; só substitui o anterior em concluir()."""
+
+    def __init__(self, caminho_cache, caminho_json):
+        self.caminho_cache = caminho_cache
+        self._temporario = caminho_cache + '.tmp'
+        self._arquivo = open(self._temporario, 'wb')
+        self._lote = []
+        marshal.dump(_assinatura(caminho_json), self._arquivo)
+
+    def adicionar(self, dados):
+        avaliacoes = dados['avaliacao']
+        if isinstance(avaliacoes, ColecaoAvaliacoes):
+            clientes, notas = avaliacoes.colunas()
+        else:
+            clientes = [avaliacao['cliente'] for avaliacao in avaliacoes]
+            notas = array('d', (avaliacao['nota'] for avaliacao in avaliacoes)).tobytes()
+        self._lote.append((dados['nome'], dados['categoria'], dados['ativo'], clientes, notas))
+        if len(self._lote) >= TAMANHO_LOTE:
+            self._gravar_lote()
+
+    def _gravar_lote(self):
+        marshal.dump(('lote', self._lote), self._arquivo)
+        self._lote = []
+
+    def concluir(self, seq):
+        if self._lote:
+            self._gravar_lote()
+        marshal.dump(('fim', seq), self._arquivo)
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._arquivo.close()
+        os.replace(self._temporario, self.caminho_cache)
+
+    def descartar(self):
+        self._arquivo.close()
+        try:
+            os.remove(self._temporario)
+        except OSError:
+            pass
+
+
+class LeitorSnapshot:
+    """Lê o snapshot pelo cache quando ele está atualizado; caso contrário, pelo JSON.
+
+    O cache é só uma otimização: se estiver danificado ele é apagado e a leitura continua
+    pelo JSON, pulando os restaurantes já entregues (os dois têm a mesma ordem).
+    Com gravar_cache=True, a leitura do JSON também recria o cache.
+    """
+
+    def __init__(self, caminho_json, caminho_cache, gravar_cache=True):
+        self.caminho_json = caminho_json
+        self.caminho_cache = caminho_cache
+        self.gravar_cache = gravar_cache
+        self.seq = 0
+        self.renomeados = []
+        self._leitor = None
+
+    @property
+    def progresso(self):
+        return self._leitor.progresso if self._leitor is not None else 0.0
+
+    def __iter__(self):
+        entregues = 0
+        self._leitor = ler_cache(self.caminho_cache, self.caminho_json)
+        if self._leitor is not None:
+            contar('journal.carga_pelo_cache')
+            try:
+                for dados in self._leitor:
+                    yield dados
+                    entregues += 1
+                self.seq = self._leitor.seq
+                return
+            except CacheInvalido:
+                contar('journal.cache_invalido')
+                try:
+                    os.remove(self.caminho_cache)
+                except OSError:
+                    pass
+        else:
+            contar('journal.carga_pelo_json')
+
+        self._leitor = LeitorRestaurantes(self.caminho_json)
+        gravador = None
+        if self.gravar_cache:
+            try:
+                gravador = GravadorCache(self.caminho_cache, self.caminho_json)
+            except OSError:
+                pass  # Sem permissão de escrita: segue apenas com o JSON
+        try:
+            for indice, dados in enumerate(self._leitor):
+                if gravador is not None:
+                    try:
+                        gravador.adicionar(dados)
+                    except OSError:
+                        gravador.descartar()
+                        gravador = None
+                if indice >= entregues:
+                    yield dados
+        except BaseException:
+            if gravador is not None:
+                gravador.descartar()
+            raise
+        if gravador is not None:
+            try:
+                gravador.concluir(self._leitor.seq)
+            except OSError:
+                gravador.descartar()
+        self.seq = self._leitor.seq
+        self.renomeados = self._leitor.renomeados
@@ -0,0 +1,95 @@
+import functools
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Desligada por padrão; RESTAURANTES_PERFIL=1 liga a coleta desde o início
+_ativa = os.environ.get('RESTAURANTES_PERFIL') == '1'
+_lock = threading.Lock()
+_tempos = {}  # nome -> [chamadas, segundos no total, maior duração]
+_contadores = Counter()
+
+
+def ativar(ativa=True):
+    global _ativa
+    _ativa = ativa
+
+
+def ativa():
+    return _ativa
+
+
+def _registrar_tempo(nome, duracao):
+    with _lock:
+        tempo = _tempos.setdefault(nome, [0, 0.0, 0.0])
+        tempo[0] += 1
+        tempo[1] += duracao
+        tempo[2] = max(tempo[2], duracao)
+
+
+@contextmanager
+def medir(nome):
+    """Mede a duração do bloco quando a instrumentação está ativa."""
+    if not _ativa:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        _registrar_tempo(nome, time.perf_counter() - inicio)
+
+
+def medido(nome=None):
+    """Decorador que mede cada chamada da função; com a coleta desligada custa só um if."""
+    def decorador(funcao):
+        rotulo = nome or funcao.__qualname__
+
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if not _ativa:
+                return funcao(*args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                _registrar_tempo(rotulo, time.perf_counter() - inicio)
+        return envolvida
+    return decorador
+
+
+def contar(nome, quantidade=1):
+    if _ativa:
+        with _lock:
+            _contadores[nome] += quantidade
+
+
+def relatorio():
+    """Retorna os tempos (em ms) e contadores coletados até agora."""
+    with _lock:
+        return {
+            'tempos': {
+                nome: {
+                    'chamadas': chamadas,
+                    'total_ms': round(total * 1000, 3),
+                    'media_ms': round(total * 1000 / chamadas, 3),
+                    'max_ms': round(maximo * 1000, 3),
+                }
+                for nome, (chamadas, total, maximo) in sorted(_tempos.items(), key=lambda item: -item[1][1])
+            },
+            'contadores': dict(_contadores),
+        }
+
+
+def salvar_relatorio(caminho):
+    import json  # Só necessário ao salvar; fica fora do caminho da inicialização
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(relatorio(), arquivo, indent=4, ensure_ascii=False)
+
+
+def limpar():
+    with _lock:
+        _tempos.clear()
+        _contadores.clear()
@@ -0,0 +1,189 @@
+import codecs
+import json
+import os
+
+from modelos.registro import RegistroRestaurantes
+
+_ESPACOS = ' \t\r\n'
+
+
+def validar_restaurante(dados, indice):
+    # Confere o formato de um restaurante lido do JSON antes de criar os objetos
+    if not isinstance(dados, dict):
+        raise ValueError(f"Restaurante {indice}: esperado um objeto JSON.")
+    for campo in ('nome', 'categoria'):
+        if not isinstance(dados.get(campo), str) or not dados[campo].strip():
+            raise ValueError(f"Restaurante {indice}: campo '{campo}' ausente ou vazio.")
+    if not isinstance(dados.get('ativo'), bool):
+        raise ValueError(f"Restaurante {indice}: campo 'ativo' deve ser true ou false.")
+    if not isinstance(dados.get('avaliacao'), list):
+        raise ValueError(f"Restaurante {indice}: campo 'avaliacao' deve ser uma lista.")
+    for avaliacao in dados['avaliacao']:
+        if not isinstance(avaliacao, dict) or not isinstance(avaliacao.get('cliente'), str):
+            raise ValueError(f"Restaurante {indice}: avaliação sem cliente.")
+        nota = avaliacao.get('nota')
+        if isinstance(nota, bool) or not isinstance(nota, (int, float)) or not 0 <= nota <= 10:
+            raise ValueError(f"Restaurante {indice}: a nota deve estar entre 0 e 10.")
+    return dados
+
+
+class LeitorRestaurantes:
+    """Lê dados_restaurantes.json em blocos, devolvendo um restaurante por vez.
+
+    Aceita tanto a lista de restaurantes quanto o snapshot {"seq": ..., "restaurantes": [...]}.
+    Arquivos antigos podem ter nomes que diferem só em maiúsculas/minúsculas; esses restaurantes
+    recebem um sufixo (ex.: "Alfa (2)") e ficam listados em renomeados.
+    """
+
+    def __init__(self, caminho, tamanho_bloco=1 << 16):
+        self.caminho = caminho
+        self.tamanho_bloco = tamanho_bloco
+        self.tamanho_total = os.path.getsize(caminho)
+        self.bytes_lidos = 0
+        self.seq = 0
+        self.renomeados = []  # (nome original, novo nome) dos restaurantes repetidos
+        self._chaves = set()
+        self._decodificador = json.JSONDecoder()
+
+    @property
+    def progresso(self):
+        return self.bytes_lidos / self.tamanho_total if self.tamanho_total else 1.0
+
+    def __iter__(self):
+        with open(self.caminho, 'rb') as arquivo:
+            self._arquivo = arquivo
+            self._utf8 = codecs.getincrementaldecoder('utf-8-sig')()
+            self._texto = ''
+            self._pos = 0
+            self._fim = False
+
+            inicio = self._proximo_caractere()
+            if inicio == '[':
+                yield from self._ler_lista()
+            elif inicio == '{':
+                yield from self._ler_snapshot()
+            else:
+                raise ValueError("O arquivo deve conter uma lista ou um objeto JSON.")
+            if self._proximo_caractere() is not None:
+                raise ValueError("Conteúdo inesperado após o fim dos dados.")
+
+    def _ler_bloco(self, tamanho=None):
+        bloco = self._arquivo.read(tamanho or self.tamanho_bloco)
+        self.bytes_lidos += len(bloco)
+        self._fim = not bloco
+        # Descarta o trecho já processado para manter a memória limitada ao bloco atual
+        self._texto = self._texto[self._pos:] + self._utf8.decode(bloco, final=self._fim)
+        self._pos = 0
+        return not self._fim
+
+    def _proximo_caractere(self):
+        # Pula espaços e retorna o próximo caractere sem consumi-lo (None no fim do arquivo)
+        while True:
+            while self._pos < len(self._texto) and self._texto[self._pos] in _ESPACOS:
+                self._pos += 1
+            if self._pos < len(self._texto):
+                return self._texto[self._pos]
+            if not self._ler_bloco():
+                return None
+
+    def _esperar(self, caractere):
+        if self._proximo_caractere() != caractere:
+            raise ValueError(f"JSON inválido: esperado '{caractere}' na posição {self.bytes_lidos}.")
+        self._pos += 1
+
+    def _ler_valor(self):
+        self._proximo_caractere()
+        # A cada nova tentativa lê o dobro: um valor grande é decodificado poucas vezes
+        tamanho = self.tamanho_bloco
+        while True:
+            try:
+                valor, fim = self._decodificador.raw_decode(self._texto, self._pos)
+            except json.JSONDecodeError:
+                # O valor pode estar cortado no fim do bloco: lê mais e tenta de novo
+                if self._ler_bloco(tamanho):
+                    tamanho *= 2
+                    continue
+                raise
+            # Números no fim do bloco podem continuar no próximo
+            if fim == len(self._texto) and not self._fim and self._ler_bloco():
+                continue
+            self._pos = fim
+            return valor
+
+    def _ler_itens(self, ler_item):
+        # Percorre uma lista JSON devolvendo um item por vez
+        self._esperar('[')
+        if self._proximo_caractere() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield ler_item()
+            separador = self._proximo_caractere()
+            self._pos += 1
+            if separador == ']':
+                return
+            if separador != ',':
+                raise ValueError(f"JSON inválido: esperado ',' ou ']' na posição {self.bytes_lidos}.")
+
+    def _ler_restaurante(self):
+        if self._proximo_caractere() != '{':
+            return self._ler_valor()  # validar_restaurante informa o erro
+        # Caso comum: o restaurante inteiro já está no bloco atual
+        try:
+            dados, fim = self._decodificador.raw_decode(self._texto, self._pos)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if fim < len(self._texto) or self._fim:
+                self._pos = fim
+                return dados
+        # Senão lê o objeto campo a campo e as avaliações uma a uma, para que um restaurante
+        # com muitas avaliações não seja decodificado de novo a cada bloco lido
+        self._pos += 1
+        dados = {}
+        while self._proximo_caractere() != '}':
+            campo = self._ler_valor()
+            if not isinstance(campo, str):
+                raise ValueError(f"JSON inválido: nome de campo esperado na posição {self.bytes_lidos}.")
+            self._esperar(':')
+            if campo == 'avaliacao' and self._proximo_caractere() == '[':
+                dados[campo] = list(self._ler_itens(self._ler_valor))
+            else:
+                dados[campo] = self._ler_valor()
+            if self._proximo_caractere() == ',':
+                self._pos += 1
+            elif self._proximo_caractere() != '}':
+                raise ValueError(f"JSON inválido: esperado ',' ou '}}' na posição {self.bytes_lidos}.")
+        self._pos += 1
+        return dados
+
+    def _ler_lista(self):
+        for indice, dados in enumerate(self._ler_itens(self._ler_restaurante)):
+            yield self._sem_repeticao(validar_restaurante(dados, indice))
+
+    def _sem_repeticao(self, dados):
+        # A chave segue o nome como o Restaurante o guarda, igual ao registro
+        nome = RegistroRestaurantes.normalizar_nome(dados['nome'].strip())
+        chave = RegistroRestaurantes.chave(nome)
+        if chave in self._chaves:
+            novo_nome = RegistroRestaurantes.nome_sem_conflito(nome, self._chaves)
+            self.renomeados.append((dados['nome'], novo_nome))
+            dados['nome'] = novo_nome
+            chave = RegistroRestaurantes.chave(novo_nome)
+        self._chaves.add(chave)
+        return dados
+
+    def _ler_snapshot(self):
+        self._esperar('{')
+        while self._proximo_caractere() != '}':
+            chave = self._ler_valor()
+            self._esperar(':')
+            if chave == 'restaurantes':
+                yield from self._ler_lista()
+            elif chave == 'seq':
+                self.seq = self._ler_valor()
+            else:
+                self._ler_valor()
+            if self._proximo_caractere() == ',':
+                self._pos += 1
+        self._pos += 1
@@ -0,0 +1,211 @@
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from modelos.restaurante import Restaurante
+
+COLUNAS_CSV = ['nome', 'categoria', 'ativo', 'cliente', 'nota']
+VALORES_ATIVO = {'': False, '0': False, 'false': False, 'nao': False, 'não': False, 'fechado': False,
+                 '1': True, 'true': True, 'sim': True, 'aberto': True}
+
+
+class ResultadoImportacao:
+    def __init__(self):
+        self.restaurantes = 0  # Restaurantes novos
+        self.avaliacoes = 0
+        self.erros = []  # (linha, mensagem)
+
+    def __str__(self):
+        return f'{self.restaurantes} restaurantes e {self.avaliacoes} avaliações importados, {len(self.erros)} erros'
+
+
+def _texto(valor, campo):
+    if not isinstance(valor, str) or not valor.strip():
+        raise ValueError(f"campo '{campo}' ausente ou vazio")
+    return valor.strip()
+
+
+def _nota(valor):
+    if isinstance(valor, str):
+        valor = valor.strip().replace(',', '.')
+        if not valor:
+            raise ValueError("campo 'nota' ausente ou vazio")
+        try:
+            valor = float(valor)
+        except ValueError:
+            raise ValueError(f"nota inválida: {valor}") from None
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+        raise ValueError(f"nota inválida: {valor}")
+    if not 0 <= valor <= 10:
+        raise ValueError("a nota deve estar entre 0 e 10")
+    return float(valor)
+
+
+def _ativo(valor):
+    if isinstance(valor, bool):
+        return valor
+    if isinstance(valor, str) and valor.strip().lower() in VALORES_ATIVO:
+        return VALORES_ATIVO[valor.strip().lower()]
+    raise ValueError(f"valor inválido para 'ativo': {valor}")
+
+
+def _avaliacao(dados):
+    if not isinstance(dados, dict):
+        raise ValueError("avaliação deve ser um objeto JSON")
+    return {'cliente': _texto(dados.get('cliente'), 'cliente'), 'nota': _nota(dados.get('nota'))}
+
+
+def _validar_csv(campos):
+    avaliacao = []
+    if campos.get('cliente') or campos.get('nota'):
+        avaliacao.append(_avaliacao(campos))
+    return {
+        'nome': _texto(campos.get('nome'), 'nome'),
+        'categoria': _texto(campos.get('categoria'), 'categoria'),
+        'ativo': _ativo(campos.get('ativo') or ''),
+        'avaliacao': avaliacao,
+    }
+
+
+def _validar_jsonl(dados):
+    if not isinstance(dados, dict):
+        raise ValueError("esperado um objeto JSON")
+    avaliacoes = dados.get('avaliacao', [])
+    if not isinstance(avaliacoes, list):
+        raise ValueError("campo 'avaliacao' deve ser uma lista")
+    return {
+        'nome': _texto(dados.get('nome'), 'nome'),
+        'categoria': _texto(dados.get('categoria'), 'categoria'),
+        'ativo': _ativo(dados.get('ativo', False)),
+        'avaliacao': [_avaliacao(avaliacao) for avaliacao in avaliacoes],
+    }
+
+
+def analisar_bloco(formato, cabecalho, linhas):
+    """Valida um bloco de linhas (número, texto). Executado nos processos do pool."""
+    registros = []
+    erros = []
+    for numero, texto in linhas:
+        try:
+            if formato == 'csv':
+                valores = next(csv.reader([texto]))
+                if len(valores) > len(cabecalho):
+                    raise ValueError(f"esperadas {len(cabecalho)} colunas, encontradas {len(valores)}")
+                registro = _validar_csv(dict(zip(cabecalho, valores)))
+            else:
+                registro = _validar_jsonl(json.loads(texto))
+            registros.append((numero, registro))
+        except (ValueError, csv.Error) as erro:
+            erros.append((numero, str(erro)))
+    return registros, erros
+
+
+def detectar_formato(caminho):
+    return 'jsonl' if os.path.splitext(caminho)[1].lower() in ('.jsonl', '.ndjson') else 'csv'
+
+
+def _ler_blocos(arquivo, formato, tamanho_bloco):
+    # Lê o arquivo em blocos de linhas, sem carregá-lo inteiro na memória.
+    # No CSV, cada registro deve ocupar uma única linha (sem quebras de linha dentro de aspas).
+    cabecalho = None
+    bloco = []
+    for numero, texto in enumerate(arquivo, start=1):
+        texto = texto.rstrip('\r\n')
+        if not texto.strip():
+            continue
+        if formato == 'csv' and cabecalho is None:
+            cabecalho = [coluna.strip().lower() for coluna in next(csv.reader([texto]))]
+            faltando = {'nome', 'categoria'} - set(cabecalho)
+            if faltando:
+                raise ValueError(f"Cabeçalho CSV sem as colunas: {', '.join(sorted(faltando))}")
+            continue
+        bloco.append((numero, texto))
+        if len(bloco) >= tamanho_bloco:
+            yield cabecalho, bloco
+            bloco = []
+    if bloco:
+        yield cabecalho, bloco
+
+
+def validar_arquivo(caminho, formato=None, processos=None, tamanho_bloco=5000):
+    """Valida o arquivo em blocos paralelos, devolvendo os registros válidos na ordem do arquivo."""
+    formato = formato or detectar_formato(caminho)
+    with open(caminho, 'r', encoding='utf-8-sig', newline='') as arquivo:
+        blocos = _ler_blocos(arquivo, formato, tamanho_bloco)
+        if processos == 1:
+            for cabecalho, bloco in blocos:
+                yield analisar_bloco(formato, cabecalho, bloco)
+            return
+        processos = processos or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            # Limita os blocos em andamento para manter a memória estável em arquivos grandes
+            pendentes = deque()
+            for cabecalho, bloco in blocos:
+                pendentes.append(pool.submit(analisar_bloco, formato, cabecalho, bloco))
+                if len(pendentes) >= 2 * processos:
+                    yield pendentes.popleft().result()
+            while pendentes:
+                yield pendentes.popleft().result()
+
+
+def importar(caminho, armazenamento, formato=None, processos=None, tamanho_bloco=5000, estrito=False):
+    """Importa restaurantes e avaliações e grava tudo em um único lote no armazenamento.
+
+    Restaurantes já cadastrados (ou repetidos no arquivo) recebem apenas as novas avaliações.
+    Cada bloco validado é aplicado assim que chega; só a lista de operações é mantida até o fim.
+    Com estrito=True o arquivo é validado antes em uma primeira leitura, e nada é gravado se
+    alguma linha tiver erro.
+    """
+    resultado = ResultadoImportacao()
+    if estrito:
+        for _, erros in validar_arquivo(caminho, formato, processos, tamanho_bloco):
+            resultado.erros.extend(erros)
+        if resultado.erros:
+            return resultado
+
+    operacoes = []
+    for validos, erros in validar_arquivo(caminho, formato, processos, tamanho_bloco):
+        if not estrito:
+            resultado.erros.extend(erros)
+        for numero, registro in validos:
+            _aplicar_registro(registro, operacoes, resultado)
+    armazenamento.registrar_lote(operacoes)
+    return resultado
+
+
+def _aplicar_registro(registro, operacoes, resultado):
+    restaurante = Restaurante.restaurantes.buscar(registro['nome'])
+    if restaurante is None:
+        restaurante = Restaurante(registro['nome'], registro['categoria'])
+        operacoes.append(('criar', {'nome': restaurante._nome, 'categoria': restaurante._categoria}))
+        if registro['ativo']:
+            restaurante.alternar_estado()
+            operacoes.append(('estado', {'nome': restaurante._nome, 'ativo': True}))
+        resultado.restaurantes += 1
+    for avaliacao in registro['avaliacao']:
+        restaurante.receber_avaliacao(avaliacao['cliente'], avaliacao['nota'])
+        operacoes.append(('avaliar', {'nome': restaurante._nome, **avaliacao}))
+        resultado.avaliacoes += 1
+
+
+def exportar(caminho, restaurantes, formato=None):
+    """Grava o catálogo em CSV (uma linha por avaliação) ou JSON Lines, um restaurante por vez."""
+    formato = formato or detectar_formato(caminho)
+    quantidade = 0
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        if formato == 'csv':
+            escritor = csv.writer(arquivo)
+            escritor.writerow(COLUNAS_CSV)
+        for restaurante in restaurantes:
+            dados = restaurante.to_dict()
+            if formato == 'csv':
+                ativo = 'sim' if dados['ativo'] else 'nao'
+                linhas = [[dados['nome'], dados['categoria'], ativo, avaliacao['cliente'], avaliacao['nota']]
+                          for avaliacao in dados['avaliacao']]
+                escritor.writerows(linhas or [[dados['nome'], dados['categoria'], ativo, '', '']])
+            else:
+                arquivo.write(json.dumps(dados, ensure_ascii=False) + '\n')
+            quantidade += 1
+    return quantidade
@@ -0,0 +1,105 @@
+class RegistroRestaurantes:
+    def __init__(self):
+        self._itens = {}  # id do restaurante -> restaurante (mantém a ordem de cadastro)
+        self._indice = {}  # nome normalizado -> restaurante
+        # Lista para acesso por posição; a exclusão move o último item para a vaga (O(1)),
+        # então só a iteração por _itens preserva a ordem de cadastro
+        self._sequencia = []
+        self._posicoes = {}  # id do restaurante -> posição em _sequencia
+        self._ouvintes = []  # Objetos avisados das mudanças (ex.: índices de busca)
+
+    # Regras únicas de normalização, usadas pelo modelo, pela reaplicação do log e pelo SQLite
+    @staticmethod
+    def normalizar_nome(nome):
+        return nome.title()
+
+    @staticmethod
+    def normalizar_categoria(categoria):
+        return categoria.upper()
+
+    @staticmethod
+    def chave(nome):
+        # Normaliza o nome para a busca sem diferenciar maiúsculas/minúsculas
+        return nome.strip().casefold()
+
+    @classmethod
+    def nome_sem_conflito(cls, nome, chaves):
+        # Acrescenta ' (2)', ' (3)'... até o nome não coincidir com nenhuma das chaves
+        numero = 2
+        while cls.chave(f'{nome} ({numero})') in chaves:
+            numero += 1
+        return f'{nome} ({numero})'
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __iter__(self):
+        return iter(self._itens.values())
+
+    def __contains__(self, restaurante):
+        return id(restaurante) in self._itens
+
+    @property
+    def sequencia(self):
+        # Lista interna, sem cópia: quem a recebe não deve modificá-la
+        return self._sequencia
+
+    def inscrever(self, ouvinte):
+        # O ouvinte deve ter os métodos adicionado, alterado, removido e limpo
+        self._ouvintes.append(ouvinte)
+
+    def cancelar_inscricao(self, ouvinte):
+        self._ouvintes.remove(ouvinte)
+
+    def notificar_alteracao(self, restaurante):
+        if restaurante in self:
+            for ouvinte in self._ouvintes:
+                ouvinte.alterado(restaurante)
+
+    def adicionar(self, restaurante):
+        chave = self.chave(restaurante._nome)
+        if chave in self._indice:
+            raise ValueError(f"Já existe um restaurante chamado '{restaurante._nome}'.")
+        self._indice[chave] = restaurante
+        self._itens[id(restaurante)] = restaurante
+        self._posicoes[id(restaurante)] = len(self._sequencia)
+        self._sequencia.append(restaurante)
+        for ouvinte in self._ouvintes:
+            ouvinte.adicionado(restaurante)
+
+    def buscar(self, nome):
+        return self._indice.get(self.chave(nome))
+
+    def remover(self, restaurante):
+        del self._itens[id(restaurante)]
+        del self._indice[self.chave(restaurante._nome)]
+        posicao = self._posicoes.pop(id(restaurante))
+        ultimo = self._sequencia.pop()
+        if ultimo is not restaurante:
+            self._sequencia[posicao] = ultimo
+            self._posicoes[id(ultimo)] = posicao
+        for ouvinte in self._ouvintes:
+            ouvinte.removido(restaurante)
+
+    def alterar(self, restaurante, novo_nome=None, nova_categoria=None):
+        if novo_nome:
+            novo_nome = self.normalizar_nome(novo_nome)
+            chave_antiga = self.chave(restaurante._nome)
+            chave_nova = self.chave(novo_nome)
+            if chave_nova != chave_antiga:
+                if chave_nova in self._indice:
+                    raise ValueError(f"Já existe um restaurante chamado '{novo_nome}'.")
+                del self._indice[chave_antiga]
+                self._indice[chave_nova] = restaurante
+            restaurante._nome = novo_nome
+        if nova_categoria:
+            restaurante._categoria = self.normalizar_categoria(nova_categoria)
+        self.notificar_alteracao(restaurante)
+
+    def clear(self):
+        self._itens.clear()
+        self._indice.clear()
+        self._sequencia.clear()
+        self._posicoes.clear()
+        for ouvinte in self._ouvintes:
+            ouvinte.limpo()
@@ -0,0 +1,213 @@
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+
+from modelos.instrumentacao import contar, medido
+from modelos.leitor_json import LeitorRestaurantes
+from modelos.registro import RegistroRestaurantes
+from modelos.restaurante import Restaurante
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS restaurantes (
+    id INTEGER PRIMARY KEY,
+    nome TEXT NOT NULL,
+    chave TEXT NOT NULL UNIQUE,
+    categoria TEXT NOT NULL,
+    ativo INTEGER NOT NULL DEFAULT 0,
+    quantidade_notas INTEGER NOT NULL DEFAULT 0,
+    soma_notas REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS avaliacoes (
+    id INTEGER PRIMARY KEY,
+    restaurante_id INTEGER NOT NULL REFERENCES restaurantes(id) ON DELETE CASCADE,
+    cliente TEXT NOT NULL,
+    nota REAL NOT NULL CHECK (nota BETWEEN 0 AND 10)
+);
+CREATE INDEX IF NOT EXISTS idx_restaurantes_categoria ON restaurantes(categoria);
+CREATE INDEX IF NOT EXISTS idx_restaurantes_media ON restaurantes(soma_notas / quantidade_notas);
+CREATE INDEX IF NOT EXISTS idx_avaliacoes_restaurante ON avaliacoes(restaurante_id);
+"""
+
+# Consultas parametrizadas; o sqlite3 mantém as instruções compiladas em cache
+SQL = {
+    'inserir_restaurante': "INSERT INTO restaurantes (nome, chave, categoria, ativo) VALUES (?, ?, ?, ?)",
+    'alterar_estado': "UPDATE restaurantes SET ativo = ? WHERE chave = ?",
+    'inserir_avaliacao': "INSERT INTO avaliacoes (restaurante_id, cliente, nota) "
+                         "SELECT id, ?, ? FROM restaurantes WHERE chave = ?",
+    'somar_nota': "UPDATE restaurantes SET quantidade_notas = quantidade_notas + 1, "
+                  "soma_notas = soma_notas + ? WHERE chave = ?",
+    'alterar_restaurante': "UPDATE restaurantes SET nome = COALESCE(?, nome), chave = COALESCE(?, chave), "
+                           "categoria = COALESCE(?, categoria) WHERE chave = ?",
+    'excluir_restaurante': "DELETE FROM restaurantes WHERE chave = ?",
+    'contar_restaurantes': "SELECT COUNT(*) FROM restaurantes",
+    'listar_restaurantes': "SELECT id, nome, categoria, ativo FROM restaurantes ORDER BY id",
+    'listar_avaliacoes': "SELECT restaurante_id, cliente, nota FROM avaliacoes ORDER BY restaurante_id, id",
+    'medias_por_categoria': "SELECT categoria, SUM(soma_notas) / SUM(quantidade_notas), SUM(quantidade_notas) "
+                            "FROM restaurantes WHERE quantidade_notas > 0 GROUP BY categoria ORDER BY categoria",
+    'melhores': "SELECT nome, categoria, soma_notas / quantidade_notas AS media, quantidade_notas "
+                "FROM restaurantes WHERE quantidade_notas > 0 "
+                "ORDER BY soma_notas / quantidade_notas DESC LIMIT ?",
+}
+
+
+class RepositorioSQLite:
+    """Persistência do catálogo em SQLite, alternativa ao log de operações.
+
+    A interface e a CLI continuam carregando o catálogo inteiro em memória, porque a busca
+    e a lista trabalham sobre os objetos Restaurante; medias_por_categoria e melhores
+    respondem direto pelo banco para quem consulta o arquivo sem carregá-lo.
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        # isolation_level=None: as transações são abertas explicitamente em em_lote()
+        # check_same_thread=False: a carga inicial é lida em uma thread separada da interface
+        self._conexao = sqlite3.connect(caminho, isolation_level=None, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute("PRAGMA foreign_keys=ON")
+        self._conexao.executescript(ESQUEMA)
+        self._profundidade_lote = 0
+        self.progresso = 0.0
+        self.renomeados = []  # Restaurantes com nome repetido renomeados ao importar o JSON
+
+    def _executar(self, consulta, parametros=()):
+        return self._conexao.execute(SQL[consulta], parametros)
+
+    @contextmanager
+    def em_lote(self):
+        """Agrupa várias operações em uma única transação."""
+        if self._profundidade_lote == 0:
+            self._conexao.execute("BEGIN")
+        self._profundidade_lote += 1
+        try:
+            yield self
+        except BaseException:
+            self._profundidade_lote -= 1
+            if self._profundidade_lote == 0:
+                self._conexao.execute("ROLLBACK")
+            raise
+        self._profundidade_lote -= 1
+        if self._profundidade_lote == 0:
+            self._conexao.execute("COMMIT")
+
+    def _arquivo_json(self):
+        return os.path.splitext(self.caminho)[0] + '.json'
+
+    def existe(self):
+        return self._executar('contar_restaurantes').fetchone()[0] > 0 or os.path.exists(self._arquivo_json())
+
+    @medido()
+    def carregar(self):
+        """Carrega os restaurantes do banco, importando o JSON antigo se o banco estiver vazio."""
+        Restaurante.restaurantes.clear()
+        for restaurante_dados in self.iterar_restaurantes():
+            Restaurante.from_dict(restaurante_dados)
+        self.concluir_carga()
+        return self.existe()
+
+    def iterar_restaurantes(self):
+        """Percorre restaurantes e avaliações em paralelo, ambos ordenados pelo id do restaurante."""
+        total = self._executar('contar_restaurantes').fetchone()[0]
+        if total == 0 and os.path.exists(self._arquivo_json()):
+            self.importar_json(self._arquivo_json())
+            total = self._executar('contar_restaurantes').fetchone()[0]
+
+        # Dois cursores abertos ao mesmo tempo, combinados sem montar tudo em memória
+        avaliacoes = self._conexao.cursor().execute(SQL['listar_avaliacoes'])
+        proxima = avaliacoes.fetchone()
+        for indice, (id_restaurante, nome, categoria, ativo) in enumerate(
+                self._conexao.cursor().execute(SQL['listar_restaurantes'])):
+            lista = []
+            while proxima is not None and proxima[0] == id_restaurante:
+                lista.append({'cliente': proxima[1], 'nota': proxima[2]})
+                proxima = avaliacoes.fetchone()
+            self.progresso = (indice + 1) / total
+            yield {'nome': nome, 'categoria': categoria, 'ativo': bool(ativo), 'avaliacao': lista}
+        self.progresso = 1.0
+
+    def concluir_carga(self):
+        pass
+
+    @medido()
+    def registrar(self, operacao, **dados):
+        """Aplica no banco uma operação feita no catálogo em memória."""
+        contar('sqlite.operacoes')
+        chave = RegistroRestaurantes.chave(dados['nome'])
+        with self.em_lote():
+            if operacao == 'criar':
+                self._executar('inserir_restaurante',
+                               (RegistroRestaurantes.normalizar_nome(dados['nome']), chave,
+                                RegistroRestaurantes.normalizar_categoria(dados['categoria']),
+                                int(dados.get('ativo', False))))
+                return
+            if operacao == 'estado':
+                cursor = self._executar('alterar_estado', (int(dados['ativo']), chave))
+            elif operacao == 'avaliar':
+                cursor = self._executar('inserir_avaliacao', (dados['cliente'], dados['nota'], chave))
+                self._executar('somar_nota', (dados['nota'], chave))
+            elif operacao == 'alterar':
+                novo_nome = dados.get('novo_nome')
+                novo_nome = RegistroRestaurantes.normalizar_nome(novo_nome) if novo_nome else None
+                nova_categoria = dados.get('nova_categoria')
+                cursor = self._executar('alterar_restaurante', (
+                    novo_nome,
+                    RegistroRestaurantes.chave(novo_nome) if novo_nome else None,
+                    RegistroRestaurantes.normalizar_categoria(nova_categoria) if nova_categoria else None,
+                    chave,
+                ))
+            elif operacao == 'excluir':
+                cursor = self._executar('excluir_restaurante', (chave,))
+            else:
+                raise ValueError(f"Operação desconhecida: {operacao}")
+            # Como no log, uma operação sobre um restaurante inexistente é um erro
+            if cursor.rowcount == 0:
+                raise ValueError(f"Operação '{operacao}' para restaurante inexistente: {dados['nome']}")
+
+    @medido()
+    def registrar_lote(self, operacoes):
+        """Aplica várias operações (tipo, dados) em uma única transação."""
+        with self.em_lote():
+            for operacao, dados in operacoes:
+                self.registrar(operacao, **dados)
+
+    @medido()
+    def importar_json(self, arquivo_json):
+        """Importa um dados_restaurantes.json (lista ou snapshot) em uma única transação."""
+        quantidade = 0
+        leitor = LeitorRestaurantes(arquivo_json)
+        with self.em_lote():
+            for restaurante_dados in leitor:
+                quantidade += 1
+                self.registrar('criar', nome=restaurante_dados['nome'], categoria=restaurante_dados['categoria'],
+                               ativo=restaurante_dados['ativo'])
+                for avaliacao in restaurante_dados['avaliacao']:
+                    self.registrar('avaliar', nome=restaurante_dados['nome'], **avaliacao)
+        self.renomeados = leitor.renomeados
+        return quantidade
+
+    def medias_por_categoria(self):
+        """Retorna (categoria, média, quantidade de notas) calculados no banco."""
+        return self._executar('medias_por_categoria').fetchall()
+
+    def melhores(self, quantidade=10):
+        """Retorna os restaurantes com maior média, usando o índice da média."""
+        return self._executar('melhores', (quantidade,)).fetchall()
+
+    @medido()
+    def compactar(self, em_segundo_plano=False):
+        """Transfere o WAL para o arquivo principal do banco."""
+        self._conexao.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def fechar(self, compactar=True):
+        if compactar:
+            self.compactar()
+        self._conexao.close()
+
+
+if __name__ == '__main__':
+    # Uso: python -m modelos.repositorio_sqlite dados_restaurantes.json dados_restaurantes.db
+    repositorio = RepositorioSQLite(sys.argv[2])
+    print(f"{repositorio.importar_json(sys.argv[1])} restaurantes importados para {sys.argv[2]}")
+    repositorio.fechar()
@@ -1,14 +1,22 @@
-from modelos.avaliacao import Avaliacao
+from modelos.avaliacao import ColecaoAvaliacoes
+from modelos.registro import RegistroRestaurantes
 
 class Restaurante:
-    restaurantes = []
+    restaurantes = RegistroRestaurantes()
+    # Parâmetros da média bayesiana usada para ranquear os restaurantes
+    NOTA_PRIORI = 5.0
+    PESO_PRIORI = 5
     
     def __init__(self, nome, categoria):
-        self._nome = nome.title()
-        self._categoria = categoria.upper()
+        self._nome = RegistroRestaurantes.normalizar_nome(nome)
+        self._categoria = RegistroRestaurantes.normalizar_categoria(categoria)
         self._ativo = False
-        self._avaliacao = []
-        Restaurante.restaurantes.append(self)
+        self._avaliacao = ColecaoAvaliacoes()
+        # Agregados mantidos a cada avaliação para não percorrer a lista inteira
+        self._quantidade_notas = 0
+        self._soma_notas = 0.0
+        self._soma_quadrados = 0.0
+        Restaurante.restaurantes.adicionar(self)
     
     def __str__(self):
         return f'{self._nome} | {self._categoria}'
@@ -16,26 +24,83 @@ class Restaurante:
     @classmethod
     def listar_restaurantes(cls):
         return cls.restaurantes
+
+    # Converte o restaurante em um dicionário para salvar em JSON
+    def to_dict(self):
+        return {
+            'nome': self._nome,
+            'categoria': self._categoria,
+            'ativo': self._ativo,
+            'avaliacao': self._avaliacao.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, dados):
+        restaurante = cls(dados['nome'], dados['categoria'])
+        restaurante._ativo = dados['ativo']
+        avaliacoes = dados['avaliacao']
+        # O cache binário já entrega a coleção pronta
+        if not isinstance(avaliacoes, ColecaoAvaliacoes):
+            avaliacoes = ColecaoAvaliacoes.from_dict(avaliacoes)
+        restaurante.carregar_avaliacoes(avaliacoes)
+        return restaurante
     
+    # Textos de uma linha da lista da interface; fica no modelo para ser medido sem janela
+    def valores_linha(self):
+        return (self._nome, self._categoria, str(self.media_avaliacoes), self.ativo)
+
     @property
     def ativo(self):
         return 'Aberto' if self._ativo else 'Fechado'
     
     def alternar_estado(self):
         self._ativo = not self._ativo
+        Restaurante.restaurantes.notificar_alteracao(self)
     
     def receber_avaliacao(self, cliente, nota):
         if 0 <= nota <= 10:
-            avaliacao = Avaliacao(cliente, nota)
-            self._avaliacao.append(avaliacao)
+            self._avaliacao.adicionar(cliente, nota)
+            self._somar_nota(nota)
+            Restaurante.restaurantes.notificar_alteracao(self)
         else:
             raise ValueError("A nota deve estar entre 0 e 10.")
-    
+
+    def carregar_avaliacoes(self, avaliacoes):
+        if not isinstance(avaliacoes, ColecaoAvaliacoes):
+            avaliacoes = ColecaoAvaliacoes(avaliacoes)
+        self._avaliacao = avaliacoes
+        notas = avaliacoes.notas
+        self._quantidade_notas = len(notas)
+        self._soma_notas = sum(notas)
+        self._soma_quadrados = sum(nota * nota for nota in notas)
+        Restaurante.restaurantes.notificar_alteracao(self)
+
+    def _somar_nota(self, nota):
+        self._quantidade_notas += 1
+        self._soma_notas += nota
+        self._soma_quadrados += nota * nota
+
+    @property
+    def quantidade_avaliacoes(self):
+        return self._quantidade_notas
+
     @property
     def media_avaliacoes(self):
-        if not self._avaliacao:
+        if not self._quantidade_notas:
             return '-'
-        soma_das_notas = sum(avaliacao._nota for avaliacao in self._avaliacao)
-        quantidade_de_notas = len(self._avaliacao)
-        media = round(soma_das_notas / quantidade_de_notas, 1)
-        return media
\ No newline at end of file
+        media = round(self._soma_notas / self._quantidade_notas, 1)
+        return media
+
+    @property
+    def variancia_avaliacoes(self):
+        if not self._quantidade_notas:
+            return 0.0
+        media = self._soma_notas / self._quantidade_notas
+        # max() evita valores negativos causados por arredondamento
+        return max(self._soma_quadrados / self._quantidade_notas - media * media, 0.0)
+
+    @property
+    def media_ponderada(self):
+        # Média bayesiana: restaurantes com poucas notas ficam próximos de NOTA_PRIORI
+        peso = Restaurante.PESO_PRIORI
+        return (peso * Restaurante.NOTA_PRIORI + self._soma_notas) / (peso + self._quantidade_notas)
\ No newline at end of file